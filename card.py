@@ -8,40 +8,251 @@
 
 import sys
 import json
+from contextlib import contextmanager
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QScrollArea, QLabel, QFrame, QTextEdit, QPushButton, QFileDialog,
     QMessageBox, QComboBox
 )
-from PySide6.QtCore import Qt, QMimeData, QByteArray, QDataStream, QIODevice
+from PySide6.QtCore import Qt, QMimeData, QByteArray, QDataStream, QIODevice, QObject, QTimer, Signal
 from PySide6.QtGui import QDrag, QFont, QShortcut, QKeySequence
 
+from card_export import CardExport, ExportOptionsDialog, EXPORT_FORMATS
+from card_search import CardIndex, SearchPanel
+from card_lint import LintEngine
+
+CARD_IDS_MIME = "application/x-card-ids"
+
+
+def pack_card_ids(card_ids):
+    """Drag payload: a count followed by uint32 ids — a few bytes per card however many are dragged."""
+    data = QByteArray()
+    stream = QDataStream(data, QIODevice.WriteOnly)
+    stream.writeUInt32(len(card_ids))
+    for card_id in card_ids:
+        stream.writeUInt32(card_id)
+    return data
+
+
+def unpack_card_ids(data):
+    stream = QDataStream(data, QIODevice.ReadOnly)
+    count = stream.readUInt32()
+    return [stream.readUInt32() for _ in range(count)]
+
+
+# One sheet for the whole board, parsed once at startup — widgets only carry object names
+BOARD_QSS = """
+QFrame#Card {
+    background-color: #f8f9fa;
+    border: 1px solid #ced4da;
+    border-radius: 6px;
+}
+QFrame#Card QTextEdit {
+    background-color: #f8f9fa;
+    border: 1px solid #ced4da;
+    border-radius: 6px;
+}
+QFrame#Card[selected="true"] { border: 2px solid #4dabf7; }
+QLabel#CardHeader { font-weight: bold; color: #495057; }
+QLabel#LintBadge { color: #2b8a3e; font-size: 11px; }
+QLabel#LintBadge[issues="true"] { color: #c92a2a; font-weight: bold; }
+QPushButton#SplitButton { background: #dee2e6; font-size: 11px; }
+QLabel#CardStats { color: #6c757d; font-size: 11px; }
+QLabel#ColumnHeader {
+    font-size: 16px;
+    font-weight: bold;
+    background: #e9ecef;
+    padding: 8px;
+    border-radius: 4px;
+}
+"""
+
+class BoardModel(QObject):
+    """Which column every card sits in, plus running word/char totals per column 🌱
+
+    Totals only ever move by the deltas cards report, so nothing is recounted from scratch.
+    """
+    totals_changed = Signal(str, int, int)  # column title, words, chars
+    card_added = Signal(object)
+    cleared = Signal()
+
+    def __init__(self, titles, parent=None):
+        super().__init__(parent)
+        self.cards = {}        # card_id -> Card
+        self.column_of = {}    # card_id -> column title
+        self.totals = {title: [0, 0] for title in titles}
+        self.next_id = 1
+
+    def new_id(self):
+        card_id = self.next_id
+        self.next_id += 1
+        return card_id
+
+    def add(self, card, title):
+        self.add_many([(card, title)])
+
+    def add_many(self, placements):
+        """Register [(card, title)] at once; each touched column's totals are announced once."""
+        deltas = {}
+        for card, title in placements:
+            self.cards[card.card_id] = card
+            self.column_of[card.card_id] = title
+            card.stats_changed.connect(self._on_card_stats)
+            self._accumulate(deltas, title, card.words, card.chars)
+        self._apply_deltas(deltas)
+        for card, _ in placements:
+            self.card_added.emit(card)
+
+    def move(self, card, title):
+        self.move_many([(card, title)])
+
+    def move_many(self, moves):
+        deltas = {}
+        for card, title in moves:
+            old = self.column_of.get(card.card_id)
+            if old is None or old == title:
+                continue
+            self.column_of[card.card_id] = title
+            self._accumulate(deltas, old, -card.words, -card.chars)
+            self._accumulate(deltas, title, card.words, card.chars)
+        self._apply_deltas(deltas)
+
+    def clear(self):
+        self.cards.clear()
+        self.column_of.clear()
+        for title, totals in self.totals.items():
+            totals[0] = totals[1] = 0
+            self.totals_changed.emit(title, 0, 0)
+        self.cleared.emit()
+
+    def _on_card_stats(self, card, words_delta, chars_delta):
+        title = self.column_of.get(card.card_id)
+        if title is not None:
+            self._shift(title, words_delta, chars_delta)
+
+    @staticmethod
+    def _accumulate(deltas, title, words_delta, chars_delta):
+        d = deltas.setdefault(title, [0, 0])
+        d[0] += words_delta
+        d[1] += chars_delta
+
+    def _apply_deltas(self, deltas):
+        for title, (words_delta, chars_delta) in deltas.items():
+            self._shift(title, words_delta, chars_delta)
+
+    def _shift(self, title, words_delta, chars_delta):
+        totals = self.totals[title]
+        totals[0] += words_delta
+        totals[1] += chars_delta
+        self.totals_changed.emit(title, totals[0], totals[1])
+
+
+class BoardBatch:
+    """Collects inserts, moves and restyles, then lands them all in one quiet pass 🌱
+
+    Updates and column layouts stay switched off while the batch applies,
+    so a thousand changes cost one relayout instead of a thousand.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self.cleared = False
+        self.inserts = []    # (card, column title, index or None for the end, card to follow or None)
+        self.moves = []      # (card, column title)
+        self.restyles = []   # (card, font)
+
+    def clear(self):
+        """Empty every column before anything else in the batch lands."""
+        self.cleared = True
+        self.inserts.clear()
+        self.moves.clear()
+        self.restyles.clear()
+
+    def insert(self, card, title, index=None, after=None):
+        """Queue a new card; `after` places it right behind an existing card, resolved at apply time."""
+        self.inserts.append((card, title, index, after))
+
+    def move(self, card, title):
+        self.moves.append((card, title))
+
+    def restyle(self, card, font):
+        self.restyles.append((card, font))
+
+    def apply(self):
+        board = self.board
+        columns = list(board.columns.values())
+        board.setUpdatesEnabled(False)
+        for col in columns:
+            col.card_layout.setEnabled(False)
+        try:
+            if self.cleared:
+                for col in columns:
+                    while col.card_layout.count() > 1:  # leave stretch
+                        item = col.card_layout.takeAt(0)
+                        if item.widget():
+                            item.widget().deleteLater()
+                board.model.clear()
+
+            for card, title, index, after in self.inserts:
+                col = board.columns[title]
+                if after is not None:
+                    index = col.card_layout.indexOf(after) + 1
+                col.insert_card(card, index)
+            board.model.add_many([(card, title) for card, title, _, _ in self.inserts])
+
+            for card, title in self.moves:
+                old_col = board.columns[board.model.column_of[card.card_id]]
+                old_col.card_layout.removeWidget(card)
+                board.columns[title].insert_card(card)
+            board.model.move_many(self.moves)
+
+            for card, font in self.restyles:
+                card.editor.setFont(font)
+        finally:
+            for col in columns:
+                col.card_layout.setEnabled(True)
+                col.card_layout.activate()
+            board.setUpdatesEnabled(True)
+
+
 class Card(QFrame):
+    stats_changed = Signal(object, int, int)  # card, words delta, chars delta
+
     def __init__(self, card_id, text, parent=None):
         super().__init__(parent)
         self.card_id = card_id
+        self.words = 0
+        self.chars = 0
+        self._block_words = []  # word count per text block, same order as the document
+        self._press_pos = None
+        self._collapse_on_release = False
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
         self.setMinimumHeight(140)
         self.setMaximumWidth(420)
-        self.setStyleSheet("background-color: #f8f9fa; border: 1px solid #ced4da; border-radius: 6px;")
-        self.editor.textChanged.connect(self.update_stats)
+        self.setObjectName("Card")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
 
+        header_row = QHBoxLayout()
         self.header = QLabel(f"¶ {card_id}")
-        self.header.setStyleSheet("font-weight: bold; color: #495057;")
-        layout.addWidget(self.header)
+        self.header.setObjectName("CardHeader")
+        header_row.addWidget(self.header)
+        header_row.addStretch()
+        self.lint_badge = QLabel("…")
+        self.lint_badge.setObjectName("LintBadge")
+        self.lint_badge.setToolTip("Proofreading…")
+        header_row.addWidget(self.lint_badge)
+        layout.addLayout(header_row)
 
         split_btn = QPushButton("Split Here")
-        split_btn.setStyleSheet("background: #dee2e6; font-size: 11px;")
-        split_btn.clicked.connect(self.split_card)
+        split_btn.setObjectName("SplitButton")
+        split_btn.clicked.connect(lambda: self.window().split_cards(self))
         layout.addWidget(split_btn)
 
         self.stats = QLabel()
-        self.stats.setStyleSheet("color: #6c757d; font-size: 11px;")
+        self.stats.setObjectName("CardStats")
         layout.addWidget(self.stats)
-        self.update_stats()
 
         self.editor = QTextEdit(text)
         self.editor.setAcceptRichText(False)
@@ -51,41 +262,117 @@ class Card(QFrame):
         self.editor.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         layout.addWidget(self.editor)
 
+        self.recount_stats()
+        self.editor.document().contentsChange.connect(self.update_stats)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            drag = QDrag(self)
-            mime = QMimeData()
-            mime.setData("application/x-card-id", QByteArray(str(self.card_id).encode()))
-            drag.setMimeData(mime)
-            drag.setHotSpot(event.pos())
-            drag.exec(Qt.MoveAction)
-
-    def update_stats(self):
-        text = self.editor.toPlainText()
-        words = len(text.split())
-        chars = len(text)
-        self.stats.setText(f"{words} words • {chars} chars")
+            self._press_pos = event.pos()
+            # Plain click inside a multi-selection keeps it (so the group can be dragged)
+            self._collapse_on_release = self.window().select_card(self, event.modifiers())
+
+    def mouseMoveEvent(self, event):
+        if self._press_pos is None or not (event.buttons() & Qt.LeftButton):
+            return
+        if (event.pos() - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+        self._collapse_on_release = False
+        drag = QDrag(self)
+        mime = QMimeData()
+        mime.setData(CARD_IDS_MIME, pack_card_ids(self.window().drag_ids(self)))
+        drag.setMimeData(mime)
+        drag.setHotSpot(self._press_pos)
+        self._press_pos = None
+        drag.exec(Qt.MoveAction)
+
+    def mouseReleaseEvent(self, event):
+        if self._collapse_on_release:
+            self.window().select_card(self, Qt.NoModifier, collapse=True)
+        self._press_pos = None
+        self._collapse_on_release = False
+
+    def set_selected(self, selected):
+        if self.property("selected") == selected:
+            return
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
+    def recount_stats(self):
+        """Full count, only needed once when the card is born."""
+        doc = self.editor.document()
+        self._block_words = []
+        block = doc.begin()
+        while block.isValid():
+            self._block_words.append(len(block.text().split()))
+            block = block.next()
+        self._set_stats(sum(self._block_words), doc.characterCount() - 1)
+
+    def update_stats(self, position, chars_removed, chars_added):
+        """Re-count only the blocks the edit touched (words never span a block)."""
+        doc = self.editor.document()
+        first = doc.findBlock(position).blockNumber()
+        last = doc.findBlock(position + chars_added).blockNumber()
+        if first < 0:
+            first = 0
+        if last < first:
+            last = doc.blockCount() - 1
+        # Blocks first..last now stand where first..(last - grown) used to be
+        grown = doc.blockCount() - len(self._block_words)
+        stale_end = last - grown + 1
+        if stale_end < first:
+            self.recount_stats()
+            return
+
+        fresh = []
+        block = doc.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last:
+            fresh.append(len(block.text().split()))
+            block = block.next()
+        stale = self._block_words[first:stale_end]
+        self._block_words[first:stale_end] = fresh
+
+        if len(self._block_words) != doc.blockCount():
+            self.recount_stats()  # something odd happened — heal with a full count
+            return
+        self._set_stats(self.words + sum(fresh) - sum(stale), doc.characterCount() - 1)
 
-    def split_card(self):
+    def _set_stats(self, words, chars):
+        words_delta = words - self.words
+        chars_delta = chars - self.chars
+        self.words = words
+        self.chars = chars
+        self.stats.setText(f"{words} words • {chars} chars")
+        if words_delta or chars_delta:
+            self.stats_changed.emit(self, words_delta, chars_delta)
+
+    def show_lint(self, issues):
+        if issues:
+            self.lint_badge.setText(f"⚠ {len(issues)}")
+            self.lint_badge.setToolTip("\n".join(message for _, message in issues))
+        else:
+            self.lint_badge.setText("✓")
+            self.lint_badge.setToolTip("No proofreading issues")
+        if self.lint_badge.property("issues") != bool(issues):
+            self.lint_badge.setProperty("issues", bool(issues))
+            self.lint_badge.style().unpolish(self.lint_badge)
+            self.lint_badge.style().polish(self.lint_badge)
+
+    def split_card(self, batch):
+        """Cut the selected text out into a new card queued right after this one."""
         cursor = self.editor.textCursor()
         if not cursor.hasSelection():
             return
-        selected = cursor.selectedText()
+        selected = cursor.selectedText().replace("\u2029", "\n")  # Qt's paragraph separator
         cursor.removeSelectedText()
         new_text = selected.strip()
         if not new_text:
             return
 
-        # Create new card with selected text
-        new_card = Card(app.next_id, new_text)  # global app ref needed — see below
-        # Insert after current in same column
-        parent_col = self.parent()
-        while not isinstance(parent_col, Column):
-            parent_col = parent_col.parent()
-        insert_idx = parent_col.card_layout.indexOf(self) + 1
-        parent_col.card_layout.insertWidget(insert_idx, new_card)
-        app.cards.append(new_card)
-        app.next_id += 1
+        # Create new card with selected text, right after this one in the same column
+        board = self.window()
+        new_card = Card(board.model.new_id(), new_text)
+        batch.insert(new_card, board.model.column_of[self.card_id], after=self)
 
 
 class Column(QWidget):
@@ -96,7 +383,7 @@ class Column(QWidget):
         layout.setContentsMargins(8, 8, 8, 8)
         self.header = QLabel(title)
         self.header.setAlignment(Qt.AlignCenter)
-        self.header.setStyleSheet("font-size: 16px; font-weight: bold; background: #e9ecef; padding: 8px; border-radius: 4px;")
+        self.header.setObjectName("ColumnHeader")
         layout.addWidget(self.header)
 
         self.scroll = QScrollArea()
@@ -109,20 +396,26 @@ class Column(QWidget):
 
         self.setAcceptDrops(True)
 
+    def insert_card(self, card, index=None):
+        if index is None:
+            index = self.card_layout.count() - 1  # before stretch
+        self.card_layout.insertWidget(index, card)
+
+    def show_totals(self, words, chars):
+        self.header.setText(f"{self.title}\n{words} words • {chars} chars")
+
     def dragEnterEvent(self, event):
-        if event.mimeData().hasFormat("application/x-card-id"):
+        if event.mimeData().hasFormat(CARD_IDS_MIME):
             event.acceptProposedAction()
 
     def dropEvent(self, event):
-        card_id_bytes = event.mimeData().data("application/x-card-id")
-        card_id = int(bytes(card_id_bytes).decode())
-        # Find the card by id (global lookup – hacky but simple)
-        card = next((c for c in app.cards if c.card_id == card_id), None)
-        if card:
-            # Remove from old parent
-            card.setParent(None)
-            # Add to this column's layout (before stretch)
-            self.card_layout.insertWidget(self.card_layout.count() - 1, card)
+        board = self.window()
+        card_ids = unpack_card_ids(event.mimeData().data(CARD_IDS_MIME))
+        cards = [board.model.cards[i] for i in card_ids if i in board.model.cards]
+        if cards:
+            with board.batch() as batch:
+                for card in cards:
+                    batch.move(card, self.title)
             event.acceptProposedAction()
 
 class MainWindow(QMainWindow):
@@ -130,8 +423,10 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Text Pile Proofreader")
         self.resize(1400, 900)
-        self.cards = []           # All cards for lookup
-        self.next_id = 1
+        self.model = BoardModel(["Unread", "Reviewing", "Polished", "Done"], self)
+        self._batch = None
+        self.selected = {}        # card_id -> Card, in click order
+        self._anchor = None       # card id where a Shift+click range starts
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -141,10 +436,24 @@ class MainWindow(QMainWindow):
         shortcut_next.activated.connect(self.move_selected_to_next)
 
         self.columns = {}
-        for title in ["Unread", "Reviewing", "Polished", "Done"]:
+        for title in self.model.totals:
             col = Column(title)
+            col.show_totals(0, 0)
             main_layout.addWidget(col)
             self.columns[title] = col
+        self.model.totals_changed.connect(lambda title, words, chars: self.columns[title].show_totals(words, chars))
+
+        # Search index and lint follow the model; edited cards are refreshed in a debounced sweep
+        self.search_index = CardIndex()
+        self.lint = LintEngine(self)
+        self.lint.linted.connect(self._show_lint)
+        self._dirty_cards = set()
+        self.reindex_timer = QTimer(self)
+        self.reindex_timer.setSingleShot(True)
+        self.reindex_timer.timeout.connect(self.refresh_dirty_cards)
+        self.model.card_added.connect(self._index_new_card)
+        self.model.cleared.connect(self._clear_search_index)
+        self.model.cleared.connect(self.clear_selection)
 
         # Toolbar
         toolbar = QWidget()
@@ -174,9 +483,9 @@ class MainWindow(QMainWindow):
         def change_font():
             font_name = font_combo.currentText()
             font = QFont(font_name, 14)  # base size
-            for card in self.cards:
-                card.editor.setFont(font)
-                card.update_stats()  # if you added the stats
+            with self.batch() as batch:
+                for card in self.model.cards.values():
+                    batch.restyle(card, font)  # fonts don't change counts, so no recount
 
         font_combo.currentIndexChanged.connect(change_font)
         # Add to toolbar layout
@@ -193,25 +502,156 @@ class MainWindow(QMainWindow):
         top_widget = QWidget()
         top_layout = QVBoxLayout(top_widget)
         top_layout.addWidget(toolbar)
+        self.search_panel = SearchPanel(self.model, self.search_index, refresh=self.refresh_dirty_cards)
+        self.search_panel.jump_requested.connect(self.jump_to_card)
+        top_layout.addWidget(self.search_panel)
         main_layout.insertWidget(0, top_widget)  # Hack reorder
 
+    def _index_new_card(self, card):
+        text = card.editor.toPlainText()
+        self.search_index.update(card.card_id, text)
+        self.lint.submit(card.card_id, text)
+        card.editor.textChanged.connect(lambda: self._mark_dirty(card.card_id))
+
+    def _clear_search_index(self):
+        self._dirty_cards.clear()
+        self.search_index.clear()
+        self.lint.forget()
+
+    def _show_lint(self, card_id, issues):
+        card = self.model.cards.get(card_id)
+        if card is not None:
+            card.show_lint(issues)
+
+    def _mark_dirty(self, card_id):
+        self._dirty_cards.add(card_id)
+        self.reindex_timer.start(300)
+
+    def refresh_dirty_cards(self):
+        cards = self.model.cards
+        for card_id in self._dirty_cards:
+            card = cards.get(card_id)
+            if card is None:
+                self.search_index.remove(card_id)
+                self.lint.forget(card_id)
+            else:
+                text = card.editor.toPlainText()
+                self.search_index.update(card_id, text)
+                self.lint.submit(card_id, text)
+        self._dirty_cards.clear()
+
+    def closeEvent(self, event):
+        self.lint.shutdown()
+        super().closeEvent(event)
+
+    def jump_to_card(self, card_id):
+        card = self.model.cards.get(card_id)
+        if card is None:
+            return
+        col = self.columns[self.model.column_of[card_id]]
+        col.scroll.ensureWidgetVisible(card)
+        card.editor.setFocus()
+
+    @contextmanager
+    def batch(self):
+        """Gather board changes and apply them in one pass; nested batches join the outer one."""
+        if self._batch is not None:
+            yield self._batch
+            return
+        self._batch = BoardBatch(self)
+        try:
+            yield self._batch
+            self._batch.apply()
+        finally:
+            self._batch = None
+
+    def select_card(self, card, modifiers, collapse=False):
+        """Click selection: Ctrl toggles, Shift extends a range within the column.
+
+        Returns True when a plain click landed inside a multi-selection; the card then
+        collapses the selection on release unless a drag started in between.
+        """
+        card_id = card.card_id
+        if modifiers & Qt.ControlModifier:
+            if card_id in self.selected:
+                self.selected.pop(card_id).set_selected(False)
+            else:
+                self.selected[card_id] = card
+                card.set_selected(True)
+            self._anchor = card_id
+            return False
+
+        column_of = self.model.column_of
+        if modifiers & Qt.ShiftModifier and self._anchor in self.model.cards \
+                and column_of[self._anchor] == column_of[card_id]:
+            layout = self.columns[column_of[card_id]].card_layout
+            a = layout.indexOf(self.model.cards[self._anchor])
+            b = layout.indexOf(card)
+            for i in range(min(a, b), max(a, b) + 1):
+                other = layout.itemAt(i).widget()
+                if other is not None:
+                    self.selected[other.card_id] = other
+                    other.set_selected(True)
+            return False
+
+        if not collapse and card_id in self.selected and len(self.selected) > 1:
+            return True
+        self.clear_selection()
+        self.selected[card_id] = card
+        card.set_selected(True)
+        self._anchor = card_id
+        return False
+
+    def clear_selection(self):
+        for card in self.selected.values():
+            card.set_selected(False)
+        self.selected.clear()
+
+    def ordered_selection(self):
+        """Selected cards in board order (column by column, top to bottom), in one pass."""
+        if not self.selected:
+            return []
+        ordered = []
+        for col in self.columns.values():
+            layout = col.card_layout
+            for i in range(layout.count() - 1):  # skip stretch
+                card = layout.itemAt(i).widget()
+                if card is not None and card.card_id in self.selected:
+                    ordered.append(card)
+        return ordered
+
+    def drag_ids(self, card):
+        if card.card_id in self.selected:
+            return [c.card_id for c in self.ordered_selection()]
+        return [card.card_id]
+
+    def split_cards(self, card):
+        """Split every selected card at its own text selection (or just this card)."""
+        targets = self.ordered_selection() if card.card_id in self.selected else [card]
+        with self.batch() as batch:
+            for target in targets:
+                target.split_card(batch)
+
     def move_selected_to_next(self):
-        # Find focused card (hacky: check which editor has focus)
-        focused = QApplication.focusWidget()
-        if isinstance(focused, QTextEdit):
+        cards = self.ordered_selection()
+        if not cards:
+            # Fall back to the card whose editor has focus
+            focused = QApplication.focusWidget()
+            if not isinstance(focused, QTextEdit):
+                return
             card = focused.parent()
-            while not isinstance(card, Card):
+            while card is not None and not isinstance(card, Card):
                 card = card.parent()
-            if card:
-                current_col = card.parent()
-                while not isinstance(current_col, Column):
-                    current_col = current_col.parent()
-                cols = list(self.columns.values())
-                idx = cols.index(current_col)
-                if idx < len(cols) - 1:
-                    next_col = cols[idx + 1]
-                    card.setParent(None)
-                    next_col.card_layout.insertWidget(next_col.card_layout.count() - 1, card)
+            if card is None:
+                return
+            cards = [card]
+
+        titles = list(self.columns)
+        with self.batch() as batch:
+            for card in cards:
+                idx = titles.index(self.model.column_of[card.card_id])
+                if idx < len(titles) - 1:
+                    batch.move(card, titles[idx + 1])
 
     def load_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open Text File", "", "Text Files (*.txt *.md)")
@@ -225,22 +665,14 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Oops", "No paragraphs found!")
                 return
 
-            # Clear old cards
-            for col in self.columns.values():
-                while self.card_layout.count() > 1:  # leave stretch
-                    item = col.card_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-            self.cards.clear()
-            self.next_id = 1
-
-            # Add to "Unread"
-            unread = self.columns["Unread"]
-            for para in paragraphs:
-                card = Card(self.next_id, para)
-                unread.card_layout.insertWidget(unread.card_layout.count() - 1, card)
-                self.cards.append(card)
-                self.next_id += 1
+            with self.batch() as batch:
+                # Clear old cards
+                batch.clear()
+                self.model.next_id = 1
+
+                # Add to "Unread"
+                for para in paragraphs:
+                    batch.insert(Card(self.model.new_id(), para), "Unread")
 
             QMessageBox.information(self, "Loaded", f"Split into {len(paragraphs)} cards.")
         except Exception as e:
@@ -262,25 +694,31 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Saved", "Progress saved!")
 
     def export_text(self):
-        all_text = []
-        for title in ["Polished", "Done"]:  # or all columns
-            col = self.columns[title]
-            for i in range(col.card_layout.count() - 1):
-                card = col.card_layout.itemAt(i).widget()
-                if card:
-                    all_text.append(card.editor.toPlainText())
-        if not all_text:
+        options = ExportOptionsDialog(list(self.columns), parent=self)
+        if not options.exec():
+            return
+        titles = options.selected_titles()
+        fmt = options.selected_format()
+        if not any(self.columns[t].card_layout.count() > 1 for t in titles):
             QMessageBox.warning(self, "Nothing", "No polished text yet!")
             return
-        out = "\n\n".join(all_text) + "\n"
-        path, _ = QFileDialog.getSaveFileName(self, "Export Clean Text", "", "Text (*.txt)")
-        if path:
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(out)
-            QMessageBox.information(self, "Exported", f"Saved to {path}")
+        file_filter, ext = EXPORT_FORMATS[fmt]
+        path, _ = QFileDialog.getSaveFileName(self, "Export Clean Text", "", file_filter)
+        if not path:
+            return
+        if not path.lower().endswith(ext):
+            path += ext
+
+        # Streams card by card on a writer thread — the window stays usable meanwhile
+        export = CardExport(self, titles, fmt, path, self)
+        export.done.connect(lambda count, out: QMessageBox.information(
+            self, "Exported", f"Saved {count} cards to {out}"))
+        export.failed.connect(lambda msg: QMessageBox.critical(self, "Error", msg))
+        export.start()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    app.setStyleSheet(BOARD_QSS)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
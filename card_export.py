@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - card_export.py streaming export for the proofreader board
+-The last of the exports walked the board one card at a time and never carried more than it needed, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+import json
+import queue
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, QComboBox,
+    QDialogButtonBox
+)
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
+
+# name -> (file dialog filter, extension)
+EXPORT_FORMATS = {
+    "Plain text": ("Text (*.txt)", ".txt"),
+    "Markdown": ("Markdown (*.md)", ".md"),
+    "JSON Lines": ("JSON Lines (*.jsonl)", ".jsonl"),
+}
+
+FEED_SLICE = 200      # cards handed over per event-loop tick
+QUEUE_LIMIT = 256     # cards allowed in flight between the board and the writer
+
+
+class ExportWriter(QThread):
+    """Drains cards from a bounded queue straight onto disk, off the GUI thread 🌱"""
+    done = Signal(int, str)    # cards written, path
+    failed = Signal(str)
+
+    def __init__(self, path, fmt, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.fmt = fmt
+        self.queue = queue.Queue(maxsize=QUEUE_LIMIT)
+        self.aborted = False
+
+    def run(self):
+        written = 0
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                while True:
+                    item = self.queue.get()
+                    if item is None:
+                        break
+                    card_id, column, text = item
+                    f.write(self._render(card_id, column, text, written == 0))
+                    written += 1
+                if self.fmt == "Plain text" and written:
+                    f.write("\n")
+        except Exception as e:
+            self.aborted = True
+            self.failed.emit(str(e))
+            return
+        self.done.emit(written, self.path)
+
+    def _render(self, card_id, column, text, first):
+        if self.fmt == "Markdown":
+            return f"## ¶ {card_id}\n\n{text}\n\n"
+        if self.fmt == "JSON Lines":
+            return json.dumps({"id": card_id, "column": column, "text": text}, ensure_ascii=False) + "\n"
+        return text if first else "\n\n" + text
+
+
+class CardExport(QObject):
+    """Walks the board a slice per tick and feeds the writer, so the window never stalls.
+
+    Only card ids are gathered up front; each card's text is read on the GUI thread
+    right before it is queued, and the queue is bounded, so memory stays flat.
+    """
+    done = Signal(int, str)
+    failed = Signal(str)
+
+    def __init__(self, board, titles, fmt, path, parent=None):
+        super().__init__(parent)
+        self.board = board
+        self.order = []
+        for title in titles:
+            layout = board.columns[title].card_layout
+            for i in range(layout.count() - 1):  # skip stretch
+                card = layout.itemAt(i).widget()
+                if card:
+                    self.order.append((card.card_id, title))
+        self._next = 0
+        self._sealed = False
+
+        self.writer = ExportWriter(path, fmt, self)
+        self.writer.done.connect(self.done)
+        self.writer.failed.connect(self.failed)
+        self.writer.finished.connect(self.deleteLater)
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._feed)
+
+    def start(self):
+        self.writer.start()
+        self._timer.start(0)
+
+    def _feed(self):
+        if self.writer.aborted:
+            self._timer.stop()
+            return
+        q = self.writer.queue
+        cards = self.board.model.cards
+        end = min(self._next + FEED_SLICE, len(self.order))
+        while self._next < end:
+            card_id, title = self.order[self._next]
+            card = cards.get(card_id)
+            if card is not None:
+                try:
+                    q.put_nowait((card_id, title, card.editor.toPlainText()))
+                except queue.Full:
+                    return  # writer is busy — try again next tick
+            self._next += 1
+        if self._next >= len(self.order) and not self._sealed:
+            try:
+                q.put_nowait(None)
+            except queue.Full:
+                return
+            self._sealed = True
+            self._timer.stop()
+
+
+class ExportOptionsDialog(QDialog):
+    """Pick which columns and which format go out the door."""
+
+    def __init__(self, titles, checked=("Polished", "Done"), parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Export Clean Text")
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Columns to export:"))
+        self.boxes = {}
+        for title in titles:
+            box = QCheckBox(title)
+            box.setChecked(title in checked)
+            layout.addWidget(box)
+            self.boxes[title] = box
+
+        fmt_row = QHBoxLayout()
+        fmt_row.addWidget(QLabel("Format:"))
+        self.format_combo = QComboBox()
+        self.format_combo.addItems(list(EXPORT_FORMATS))
+        fmt_row.addWidget(self.format_combo)
+        layout.addLayout(fmt_row)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def selected_titles(self):
+        return [title for title, box in self.boxes.items() if box.isChecked()]
+
+    def selected_format(self):
+        return self.format_combo.currentText()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - card_lint.py background proofreading for the board
+-The last of the lint passes worked quietly in the next room and only knocked when it found something, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from lint_rules import lint_batch, text_hash
+
+BATCH_SIZE = 64   # texts per worker task — keeps pickling overhead small on big boards
+
+
+class LintEngine(QObject):
+    """Lints card text on a process pool; results are cached by content hash 🌱
+
+    Unchanged text is never re-checked: a cache hit answers straight away, and several
+    cards with identical text share one pending job.
+    """
+    linted = Signal(int, object)       # card_id, [(rule, message)]
+    _batch_done = Signal(object)       # [(hash, issues)] — hops back to the GUI thread
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cache = {}          # hash -> issues
+        self.latest = {}         # card_id -> hash of its newest text
+        self.waiting = {}        # hash -> {card_id} for jobs still in flight
+        self.queued = []         # [(hash, text)] not yet handed to the pool
+        self.pool = None
+        self._batch_done.connect(self._on_batch_done)
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self._flush)
+
+    def submit(self, card_id, text):
+        h = text_hash(text)
+        self.latest[card_id] = h
+        if h in self.cache:
+            self.linted.emit(card_id, self.cache[h])
+            return
+        if h not in self.waiting:
+            self.waiting[h] = set()
+            self.queued.append((h, text))
+            self.flush_timer.start(0)
+        self.waiting[h].add(card_id)
+
+    def forget(self, card_id=None):
+        """Drop pending answers for one card, or for every card when card_id is None."""
+        if card_id is None:
+            self.latest.clear()
+        else:
+            self.latest.pop(card_id, None)
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    def _flush(self):
+        if not self.queued:
+            return
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor()
+        queued, self.queued = self.queued, []
+        for i in range(0, len(queued), BATCH_SIZE):
+            batch = queued[i:i + BATCH_SIZE]
+            future = self.pool.submit(lint_batch, batch)
+            future.add_done_callback(partial(self._on_future_done, [h for h, _ in batch]))
+
+    def _on_future_done(self, hashes, future):
+        # Runs on the executor's helper thread — only emit, let Qt queue it over
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self._batch_done.emit([(h, None) for h in hashes])  # un-stick them so a later edit retries
+            return
+        self._batch_done.emit(future.result())
+
+    def _on_batch_done(self, results):
+        for h, issues in results:
+            if issues is None:
+                self.waiting.pop(h, None)
+                continue
+            self.cache[h] = issues
+            for card_id in self.waiting.pop(h, ()):
+                if self.latest.get(card_id) == h:
+                    self.linted.emit(card_id, issues)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - card_search.py find any paragraph on the proofreader board
+-The last of the searches knew where every word slept and went straight there, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+import re
+import math
+import heapq
+from bisect import bisect_left, insort
+from collections import Counter
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, QListWidget, QListWidgetItem
+from PySide6.QtCore import Qt, QTimer, Signal
+
+TOKEN_RE = re.compile(r"\w+")
+ALL_COLUMNS = "All columns"
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+class CardIndex:
+    """Inverted index over card text, patched per card by the tokens that actually changed 🌱
+
+    postings: token -> {card_id: term count}. The last query word also matches as a
+    prefix, so results show up while you are still typing it.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.doc_terms = {}     # card_id -> Counter of its tokens
+        self.doc_len = {}       # card_id -> token count
+        self.vocab = []         # sorted tokens, for prefix lookups
+
+    def __len__(self):
+        return len(self.doc_terms)
+
+    def clear(self):
+        self.postings.clear()
+        self.doc_terms.clear()
+        self.doc_len.clear()
+        self.vocab.clear()
+
+    def update(self, card_id, text):
+        fresh = Counter(tokenize(text))
+        stale = self.doc_terms.get(card_id, Counter())
+        for token in stale.keys() - fresh.keys():
+            self._drop(token, card_id)
+        for token, count in fresh.items():
+            if stale.get(token) != count:
+                posting = self.postings.get(token)
+                if posting is None:
+                    posting = self.postings[token] = {}
+                    insort(self.vocab, token)
+                posting[card_id] = count
+        self.doc_terms[card_id] = fresh
+        self.doc_len[card_id] = sum(fresh.values())
+
+    def remove(self, card_id):
+        for token in self.doc_terms.pop(card_id, ()):
+            self._drop(token, card_id)
+        self.doc_len.pop(card_id, None)
+
+    def _drop(self, token, card_id):
+        posting = self.postings[token]
+        posting.pop(card_id, None)
+        if not posting:
+            del self.postings[token]
+            del self.vocab[bisect_left(self.vocab, token)]
+
+    def _prefix_tokens(self, prefix, limit=64):
+        i = bisect_left(self.vocab, prefix)
+        out = []
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix) and len(out) < limit:
+            out.append(self.vocab[i])
+            i += 1
+        return out
+
+    def search(self, query, accept=None, limit=50):
+        """Return [(score, card_id)], best first. Every query word must match.
+
+        accept: optional card_id -> bool filter (e.g. "only this column").
+        """
+        words = tokenize(query)
+        if not words or not self.doc_terms:
+            return []
+        n_docs = len(self.doc_terms)
+
+        # Each query word becomes a group of index tokens; the last one is prefix-expanded
+        groups = [[w] if w in self.postings else [] for w in words[:-1]]
+        groups.append(self._prefix_tokens(words[-1]))
+        if any(not g for g in groups):
+            return []
+
+        group_hits = []
+        for group in groups:
+            hits = {}
+            for token in group:
+                posting = self.postings[token]
+                idf = math.log(1 + n_docs / len(posting))
+                for card_id, count in posting.items():
+                    hits[card_id] = hits.get(card_id, 0.0) + count * idf
+            group_hits.append(hits)
+        group_hits.sort(key=len)
+
+        scored = []
+        for card_id, score in group_hits[0].items():
+            if accept is not None and not accept(card_id):
+                continue
+            for hits in group_hits[1:]:
+                extra = hits.get(card_id)
+                if extra is None:
+                    break
+                score += extra
+            else:
+                scored.append((score / math.sqrt(self.doc_len[card_id] or 1), card_id))
+        return heapq.nlargest(limit, scored)
+
+
+class SearchPanel(QWidget):
+    """Search bar + column filter + ranked results; activating a result asks to jump there."""
+    jump_requested = Signal(int)
+
+    def __init__(self, model, index, refresh=None, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.index = index
+        self.refresh = refresh  # called before each query so pending edits are searchable
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        row = QHBoxLayout()
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("Search cards…")
+        self.query_input.setClearButtonEnabled(True)
+        row.addWidget(self.query_input, stretch=1)
+        self.column_filter = QComboBox()
+        self.column_filter.addItem(ALL_COLUMNS)
+        self.column_filter.addItems(list(model.totals))
+        row.addWidget(self.column_filter)
+        layout.addLayout(row)
+
+        self.results = QListWidget()
+        self.results.setVisible(False)
+        self.results.itemActivated.connect(self._on_activated)
+        self.results.itemClicked.connect(self._on_activated)
+        layout.addWidget(self.results)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.run_search)
+        self.query_input.textChanged.connect(lambda: self.search_timer.start(120))
+        self.column_filter.currentIndexChanged.connect(self.run_search)
+
+    def run_search(self):
+        query = self.query_input.text().strip()
+        self.results.clear()
+        if not query:
+            self.results.setVisible(False)
+            return
+
+        if self.refresh:
+            self.refresh()
+        column = self.column_filter.currentText()
+        accept = None
+        if column != ALL_COLUMNS:
+            column_of = self.model.column_of
+            accept = lambda card_id: column_of.get(card_id) == column
+
+        words = tokenize(query)
+        for score, card_id in self.index.search(query, accept):
+            card = self.model.cards.get(card_id)
+            if card is None:
+                continue
+            label = f"¶ {card_id} · {self.model.column_of.get(card_id, '?')} — {self._snippet(card.editor.toPlainText(), words)}"
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, card_id)
+            self.results.addItem(item)
+        if not self.results.count():
+            self.results.addItem("No matches")
+        self.results.setVisible(True)
+
+    @staticmethod
+    def _snippet(text, words, width=60):
+        lowered = text.lower()
+        at = min((i for i in (lowered.find(w) for w in words) if i >= 0), default=0)
+        start = max(0, at - width // 3)
+        piece = text[start:start + width].replace("\n", " ")
+        return ("…" if start else "") + piece + ("…" if start + width < len(text) else "")
+
+    def _on_activated(self, item):
+        card_id = item.data(Qt.UserRole)
+        if card_id is not None:
+            self.jump_requested.emit(card_id)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - credential_check.py Trello key testing, away from the GUI thread
+-The last of the credential checks went out to knock on Trello's door and let the window keep glowing meanwhile, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/credential_check.py
+import hashlib
+import time
+from typing import NamedTuple
+
+from PySide6.QtCore import QThread, Signal
+
+from utils.settings import Settings
+from utils.trello_api import TrelloAPI
+
+
+class CheckResult(NamedTuple):
+    state: str          # "ok" or "error" — the status label's theme state
+    status: str         # short text for the status label
+    level: str          # "information", "warning" or "critical" — which QMessageBox to show
+    title: str
+    message: str
+    checked_at: float
+
+
+def _fingerprint(api_key, token):
+    # Cache key only — the secrets themselves never sit in the cache
+    return hashlib.blake2b(f"{api_key}\0{token}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CredentialCheck(QThread):
+    """Tests the saved Trello credentials on a worker thread 🌱
+
+    cancel() only detaches the dialog: the request finishes on its own (bounded by
+    TrelloAPI.VERIFY_TIMEOUT) and its answer still lands in the cache. Definite
+    answers (valid / rejected) are remembered per credential pair, so reopening
+    Settings shows the last known status without touching the network; network
+    failures are reported but never cached.
+    """
+    result_ready = Signal(object)      # CheckResult — not emitted once cancelled
+
+    _cache = {}          # fingerprint -> CheckResult
+    _running = set()     # keeps unparented threads alive until they finish
+
+    def __init__(self):
+        super().__init__()
+        self.api_key, self.token = Settings.get_trello_creds()
+        self.cancelled = False
+        CredentialCheck._running.add(self)
+        self.finished.connect(self._release)  # queued back to the GUI thread, after run() returns
+
+    @classmethod
+    def cached(cls):
+        """Last result for the credentials saved right now, or None."""
+        api_key, token = Settings.get_trello_creds()
+        if not (api_key and token):
+            return None
+        return cls._cache.get(_fingerprint(api_key, token))
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _release(self):
+        CredentialCheck._running.discard(self)
+
+    def run(self):
+        definite = False
+        try:
+            valid = TrelloAPI.check_credentials(self.api_key, self.token) if self.api_key and self.token else False
+            if valid is None:
+                result = CheckResult(
+                    "error", "Can't reach Trello", "warning", "No Connection",
+                    "Couldn't reach Trello just now, so your keys weren't checked.\n\n"
+                    "Check your connection and try again 🌱",
+                    time.time(),
+                )
+            elif valid:
+                definite = True
+                result = CheckResult(
+                    "ok", "Connected and ready ✓", "information", "Connection Successful ✨",
+                    "Trello credentials are valid and working!\n\nYou're all set to create cozy boards 🌱",
+                    time.time(),
+                )
+            elif not (self.api_key and self.token):
+                result = CheckResult("error", "Keys look off", "warning", "Credentials Missing",
+                                     "Trello API keys missing. Please add them in Settings.", time.time())
+            else:
+                definite = True
+                result = CheckResult(
+                    "error", "Keys look off", "warning", "Invalid Credentials",
+                    "Invalid Trello API credentials. Please double-check your key and token in Settings ✨",
+                    time.time(),
+                )
+        except Exception as e:
+            result = CheckResult(
+                "error", "Hmm… issue", "critical", "Unexpected Error",
+                f"Something went wrong:\n{str(e)}", time.time(),
+            )
+        if definite:
+            # Only Trello's own yes/no is remembered; an offline moment says nothing about the keys
+            CredentialCheck._cache[_fingerprint(self.api_key, self.token)] = result
+        if not self.cancelled:
+            self.result_ready.emit(result)
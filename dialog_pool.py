@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - dialog_pool.py dialogs built once and kept warm
+-The last of the dialogs was already waiting by the door with the kettle on, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# widgets/dialog_pool.py
+from shiboken6 import isValid
+from PySide6.QtCore import QTimer
+
+
+class DialogPool:
+    """One reusable instance per dialog class, built lazily or prewarmed on idle 🌱
+
+    Reopening only calls the dialog's refresh() (when it has one) to pick up state
+    that may have changed while it was hidden — no widgets, stylesheets or pixmaps
+    are rebuilt. From the main window, once it is showing:
+
+        DialogPool.prewarm(self, [SettingsDialog, FeatureListDialog, LogViewerDialog])
+        ...
+        DialogPool.open(SettingsDialog, self)
+    """
+    _instances = {}      # dialog class -> instance
+    _queue = []          # (class, parent) still to prewarm
+
+    @classmethod
+    def get(cls, dialog_cls, parent=None):
+        dialog = cls._instances.get(dialog_cls)
+        if dialog is None or not isValid(dialog):  # its parent may have taken it down
+            dialog = cls._instances[dialog_cls] = dialog_cls(parent)
+        return dialog
+
+    @classmethod
+    def open(cls, dialog_cls, parent=None, modal=True):
+        """Refresh and show the shared instance; modal opens return exec()'s result."""
+        dialog = cls.get(dialog_cls, parent)
+        refresh = getattr(dialog, "refresh", None)
+        if refresh is not None:
+            refresh()
+        if modal:
+            return dialog.exec()
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+        return None
+
+    @classmethod
+    def prewarm(cls, parent, dialog_classes):
+        """Build the given dialogs one per event-loop turn, so startup never stalls."""
+        cls._queue.extend((dialog_cls, parent) for dialog_cls in dialog_classes)
+        QTimer.singleShot(0, cls._prewarm_next)
+
+    @classmethod
+    def _prewarm_next(cls):
+        if not cls._queue:
+            return
+        dialog_cls, parent = cls._queue.pop(0)
+        if parent is None or isValid(parent):
+            cls.get(dialog_cls, parent)
+        if cls._queue:
+            QTimer.singleShot(0, cls._prewarm_next)
@@ -25,19 +25,23 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QPixmap, QIcon
 
 from utils.settings import Settings
-from utils.trello_api import TrelloAPI
+from utils.credential_check import CredentialCheck
 from utils.helpers import Helpers
+from utils.theme import Theme
+from utils.pixmap_cache import PixmapCache
 
 from widgets.about_dialog import AboutDialog
+from widgets.dialog_pool import DialogPool
 
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
+        Theme.install()
+        self.setObjectName("SettingsDialog")
         self.setWindowTitle("The cozy beautiful settings home")
         self.setFixedSize(520, 520)
         self.setMinimumSize(520, 520)
-        self.setStyleSheet("background-color: #1e1e1e; color: #e0e0e0;")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(32, 32, 32, 32)
@@ -46,30 +50,6 @@ class SettingsDialog(QDialog):
 
         self.project_root = Helpers.get_project_root()
 
-        qpush = """
-            QPushButton {
-                background-color: #3a3a3a;
-                border: 1px solid #6b5a47;
-                border-radius: 6px;
-                color: #e0f0e0;
-                padding: 6px 12px;
-                font-size: 13px;
-            }
-            QPushButton:hover { background-color: #444444; }
-            QPushButton:disabled { background-color: #2a2a2a; color: #666666; }
-        """
-        qpushinactive = """
-                    QPushButton {
-                        background-color: #2a2a2a;
-                        border: 1px solid #4a3a2f;
-                        border-radius: 6px;
-                        color: #a08a7a;
-                        padding: 4px 8px;
-                        font-size: 13px;
-                    }
-                    QPushButton:hover { background-color: #333333; color: #e0e0e0; }
-                """
-
         # ── Trello Credentials Section ────────────────────────────────
         trello_row = QHBoxLayout()
         trello_row.setSpacing(12)
@@ -81,7 +61,7 @@ class SettingsDialog(QDialog):
         trello_row.addStretch()
 
         self.trello_status = QLabel("Not tested yet")
-        self.trello_status.setStyleSheet("color: #8a7a67; font-size: 13px;")
+        self.trello_status.setProperty("role", "status")
         self.trello_status.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         self.trello_status.setWordWrap(False)
         trello_row.addWidget(self.trello_status)
@@ -93,10 +73,10 @@ class SettingsDialog(QDialog):
 
         self.test_btn = QPushButton("Test")
         self.test_btn.setFixedHeight(28)
-        self.test_btn.setFixedWidth(50)
+        # Wide enough for its longer caption, so flipping to "Cancel" neither clips nor jumps
+        self.test_btn.setMinimumWidth(self.test_btn.fontMetrics().horizontalAdvance("Cancel") + 24)
         self.test_btn.clicked.connect(self.test_trello_connection)
-
-        self.test_btn.setStyleSheet( qpush )
+        self._check = None        # the CredentialCheck in flight, if any
 
         test_cluster.addWidget(self.test_btn)
         trello_row.addLayout(test_cluster)
@@ -115,7 +95,7 @@ class SettingsDialog(QDialog):
         app_row.addStretch()
 
         self.app_status = QLabel("No custom icon set")
-        self.app_status.setStyleSheet("color: #8a7a67; font-size: 13px;")
+        self.app_status.setProperty("role", "status")
         app_row.addWidget(self.app_status)
 
         app_row.addSpacing(16)
@@ -138,10 +118,7 @@ class SettingsDialog(QDialog):
         reset_app.setFixedWidth(70)
         reset_app.clicked.connect(lambda: self.reset_icon("icon_path", self.app_status, self.app_preview))
 
-        for btn in (choose_app, reset_app):
-            btn.setStyleSheet( qpush)
-            if btn.text() == "Reset":
-                btn.setStyleSheet( qpushinactive)
+        reset_app.setProperty("quiet", True)
 
         app_cluster.addWidget(choose_app)
         app_cluster.addWidget(reset_app)
@@ -160,7 +137,7 @@ class SettingsDialog(QDialog):
         bullet_row.addStretch()
 
         self.bullet_status = QLabel("Using default")
-        self.bullet_status.setStyleSheet("color: #8a7a67; font-size: 13px;")
+        self.bullet_status.setProperty("role", "status")
         bullet_row.addWidget(self.bullet_status)
 
         bullet_row.addSpacing(16)
@@ -183,10 +160,7 @@ class SettingsDialog(QDialog):
         reset_bullet.setFixedWidth(70)
         reset_bullet.clicked.connect(lambda: self.reset_icon("bullet_icon_path", self.bullet_status, self.bullet_preview))
 
-        for btn in (choose_bullet, reset_bullet):
-            btn.setStyleSheet(qpush)
-            if btn.text() == "Reset":
-                btn.setStyleSheet(qpushinactive)
+        reset_bullet.setProperty("quiet", True)
 
         bullet_cluster.addWidget(choose_bullet)
         bullet_cluster.addWidget(reset_bullet)
@@ -197,7 +171,6 @@ class SettingsDialog(QDialog):
         # ── About Section (bottom cozy footer) ────────────────────────────────
         about_btn = QPushButton("About Cushions")
         about_btn.setFixedHeight(28)
-        about_btn.setStyleSheet(qpush)
         about_btn.clicked.connect(self.show_about)
         layout.addWidget(about_btn, alignment=Qt.AlignRight)
 
@@ -207,7 +180,7 @@ class SettingsDialog(QDialog):
     def _add_separator(self, layout):
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
-        line.setStyleSheet("background-color: #333333; max-height: 1px;")
+        line.setProperty("role", "separator")
         layout.addWidget(line)
 
     def _get_absolute_path(self, rel_or_abs_path: str | None) -> Path:
@@ -224,15 +197,13 @@ class SettingsDialog(QDialog):
             abs_path = self._get_absolute_path(stored_path)
             if abs_path.exists():
                 status_label.setText(abs_path.name)
-                pix = QPixmap(str(abs_path)).scaled(28, 28, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                preview.setPixmap(pix)
+                preview.setPixmap(PixmapCache.get(abs_path, 28, 28) or QPixmap())
                 return
         # Default fallback
         status_label.setText(default_name)
         default_path = self.project_root / default_filename
         if default_path.exists():
-            pix = QPixmap(str(default_path)).scaled(28, 28, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            preview.setPixmap(pix)
+            preview.setPixmap(PixmapCache.get(default_path, 28, 28) or QPixmap())
         else:
             preview.setText("🖼️")  # tiny cozy placeholder
 
@@ -242,11 +213,20 @@ class SettingsDialog(QDialog):
         self._update_icon_status("bullet_icon_path", self.bullet_status, self.bullet_preview,
                                  "Using default (bullet.png)", "bullet.png")
 
+        if self._check is not None:
+            return  # a test is running; its answer will fill the status in
         api_key, token = Settings.get_trello_creds()
-        if api_key and token:
-            self.trello_status.setText("Credentials saved • Ready to test")
+        cached = CredentialCheck.cached()
+        if cached is not None:
+            self.trello_status.setText(cached.status)
+            Theme.set_state(self.trello_status, "status", cached.state)
         else:
-            self.trello_status.setText("No credentials set yet")
+            # Nothing tested since the keys changed: drop any old ok/error colour
+            Theme.set_state(self.trello_status, "status", "")
+            if api_key and token:
+                self.trello_status.setText("Credentials saved • Ready to test")
+            else:
+                self.trello_status.setText("No credentials set yet")
 
     def choose_app_icon(self):
         start_dir = Settings.get_directory("last_dir_icon") or str(self.project_root)
@@ -310,35 +290,47 @@ class SettingsDialog(QDialog):
         self._refresh_statuses()
 
     def test_trello_connection(self):
-        self.test_btn.setEnabled(False)
-        self.test_btn.setText("Testing…")
+        if self._check is not None:
+            self._cancel_test()
+            return
+        self.test_btn.setText("Cancel")
         self.trello_status.setText("Verifying your keys…")
-        self.trello_status.setStyleSheet("color: #8a7a67; font-size: 13px;")
-
-        try:
-            TrelloAPI.from_settings()
-            QMessageBox.information(
-                self, "Connection Successful ✨",
-                "Trello credentials are valid and working!\n\nYou're all set to create cozy boards 🌱"
-            )
-            self.trello_status.setText("Connected and ready ✓")
-            self.trello_status.setStyleSheet("color: #a0d0a0; font-size: 13px;")
-        except ValueError as e:
-            msg = str(e)
-            if "missing" in msg.lower():
-                title = "Credentials Missing"
-            else:
-                title = "Invalid Credentials"
-            QMessageBox.warning(self, title, msg)
-            self.trello_status.setText("Keys look off")
-            self.trello_status.setStyleSheet("color: #e08080; font-size: 13px;")
-        except Exception as e:
-            QMessageBox.critical(self, "Unexpected Error", f"Something went wrong:\n{str(e)}")
-            self.trello_status.setText("Hmm… issue")
-            self.trello_status.setStyleSheet("color: #e08080; font-size: 13px;")
-        finally:
-            self.test_btn.setEnabled(True)
+        Theme.set_state(self.trello_status, "status", "")
+
+        # The network call runs on a worker so the dialog keeps painting (and can cancel)
+        self._check = CredentialCheck()
+        self._check.result_ready.connect(self._on_test_result)
+        self._check.start()
+
+    def _detach_check(self):
+        """Stop listening to the running check; a result it already queued is dropped too."""
+        self._check.cancel()
+        self._check.result_ready.disconnect(self._on_test_result)
+        self._check = None
+
+    def _cancel_test(self):
+        self._detach_check()
+        self.test_btn.setText("Test")
+        self.trello_status.setText("Test cancelled")
+
+    def _on_test_result(self, result):
+        if self.sender() is not self._check:
+            return  # a cancelled check's answer, queued before we let go of it
+        self._check = None
+        self.test_btn.setText("Test")
+        self.trello_status.setText(result.status)
+        Theme.set_state(self.trello_status, "status", result.state)
+        getattr(QMessageBox, result.level)(self, result.title, result.message)
+
+    def done(self, code):
+        if self._check is not None:
+            self._detach_check()  # closing mid-test: let it finish quietly into the cache
             self.test_btn.setText("Test")
+        super().done(code)
+
+    def refresh(self):
+        """Reopened from the pool: pick up icon and credential changes made elsewhere."""
+        self._refresh_statuses()
 
     def show_about(self):
-        AboutDialog(self).exec()
\ No newline at end of file
+        DialogPool.open(AboutDialog, self)
\ No newline at end of file
@@ -7,27 +7,58 @@
 """
 
 # widgets/feature_list_dialog.py
+import os
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QLabel,
-    QScrollArea,
-    QWidget,
-    QHBoxLayout,
+    QListView,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
-import os
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QTimer, QFileSystemWatcher
 
+from utils.logging import AppLogger
 from utils.settings import Settings
+from utils.theme import Theme
+from utils.pixmap_cache import PixmapCache
+from utils.features import FeatureStore
+
+
+class FeatureListModel(QAbstractListModel):
+    """The wishlist as a flat list model — one row per feature, the bullet as decoration 🌱"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.features = []
+        self.bullet = None       # QPixmap, or None to fall back to a text bullet
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.features)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            text = self.features[index.row()]
+            return text if self.bullet is not None else f"•  {text}"
+        if role == Qt.DecorationRole:
+            return self.bullet
+        return None
+
+    def set_features(self, features, bullet):
+        self.beginResetModel()
+        self.features = features
+        self.bullet = bullet
+        self.endResetModel()
 
 
 class FeatureListDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
+        Theme.install()
+        self.setObjectName("FeatureListDialog")
         self.setWindowTitle("Features Overview")
         self.setFixedSize(500, 400)
-        self.setStyleSheet("background-color: #1e1e1e; color: #e0e0e0;")
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -35,92 +66,61 @@ class FeatureListDialog(QDialog):
         # Header
         title = QLabel("Current cushions achievements ✨")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold; color: #8a7a67;")
+        title.setObjectName("FeatureTitle")
         main_layout.addWidget(title)
         main_layout.addSpacing(10)
 
-        # Scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
-        content = QWidget()
-        content_layout = QVBoxLayout(content)
-        content_layout.setSpacing(8)
-
-        # Bullet icon logic
+        # The list — only rows in view are ever laid out and painted
+        self.model = FeatureListModel(self)
+        self.view = QListView()
+        self.view.setObjectName("FeatureList")
+        self.view.setModel(self.model)
+        self.view.setWordWrap(True)
+        self.view.setIconSize(QSize(20, 20))
+        self.view.setSpacing(4)
+        self.view.setSelectionMode(QListView.NoSelection)
+        self.view.setFocusPolicy(Qt.NoFocus)
+        self.view.setLayoutMode(QListView.Batched)   # thousands of rows: lay out in slices, stay responsive
+        self.view.setBatchSize(200)
+        main_layout.addWidget(self.view)
+
+        self._bullet_warned = False   # a missing icon is reported once, not on every reload
+
+        # Hot reload — the watcher nudges, a short timer lets an editor finish saving
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._schedule_reload)
+        self.watcher.directoryChanged.connect(self._schedule_reload)
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.timeout.connect(self.reload)
+
+        self.reload()
+
+    def _bullet(self):
         custom_path = Settings.get("bullet_icon_path")
         fallback_path = "assets/icons/bulletpoint.ico"
-
-        pixmap = None
-        bullet_text = None
-
-        if custom_path and os.path.exists(custom_path):
-            temp_pix = QPixmap(custom_path)
-            if not temp_pix.isNull():
-                pixmap = temp_pix
-
-        if pixmap is None:
-            temp_pix = QPixmap(fallback_path)
-            if not temp_pix.isNull():
-                pixmap = temp_pix
-            else:
-                bullet_text = "•"
-                print("Warning: No valid bullet icon found (custom or fallback)")
-
-        # ── The features list ── (moved here so it's defined before the loop)
-        features = [
-            "Dark cozy theme with soft pastel accents",
-            "Drag-and-drop file area with hover feedback",
-            "Browse file button",
-            "Live progress bar during upload",
-            "Creates new Trello board with custom name",
-            "Adds paragraphs as cards in 'To Review' list",
-            "Cards named 'Note N' (pretty, customizable)",
-            "Truncates long descriptions to fit Trello limits",
-            "Success message with 'Open now?' popup",
-            "Auto-opens board in browser on confirmation",
-            "Sensitivity slider for zoom drag speed (saved)",
-            "Settings gear to change app icon (saved)",
-            "Feature list icon (📋) to view this dialog",
-            "Daily logging to trello_log_YYYY-MM-DD.txt",
-            "Graceful error handling with friendly messages",
-            "Made with one shared braincell (and zero regrets) 🧠💀",
-            "Refuses to resize (perfection needs no opinions)",
-            "Sleeps dramatically between Trello cards (0.6s of pure theater)",
-            "Has a heart icon with perfect alpha (no jagged edges allowed)",
-            "Opens an About box that proudly confesses it was made with literally one shared braincell",
-            "Logs its own existence with zero irony",
-            "Log viewer now has real-time search/filter (type to find messages instantly)",
-        ]
-
-        for feature in features:
-            row_widget = QWidget()
-            row_layout = QHBoxLayout(row_widget)
-            row_layout.setContentsMargins(0, 2, 0, 2)
-            row_layout.setSpacing(10)
-
-            bullet_label = QLabel()
-            bullet_label.setFixedSize(28, 28)
-            bullet_label.setAlignment(Qt.AlignCenter)
-
-            if pixmap and not pixmap.isNull():
-                scaled = pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                bullet_label.setPixmap(scaled)
-            else:
-                bullet_label.setText(bullet_text or "•")
-                bullet_label.setStyleSheet("font-size: 18px; color: #8a7a67;")
-
-            row_layout.addWidget(bullet_label)
-
-            text_label = QLabel(feature)
-            text_label.setWordWrap(True)
-            text_label.setStyleSheet("font-size: 13px;")
-            row_layout.addWidget(text_label)
-
-            row_layout.addStretch()
-
-            content_layout.addWidget(row_widget)
-
-        content_layout.addStretch()
-        scroll.setWidget(content)
-        main_layout.addWidget(scroll)
\ No newline at end of file
+        pixmap = PixmapCache.get(custom_path, 20, 20) or PixmapCache.get(fallback_path, 20, 20)
+        if pixmap is None and not self._bullet_warned:
+            self._bullet_warned = True
+            AppLogger.get().debug("No valid bullet icon found (custom or fallback); using a text bullet")
+        return pixmap
+
+    def refresh(self):
+        self.reload()  # a stat when nothing changed, so reopening stays instant
+
+    def reload(self):
+        features, bullet = FeatureStore.load(), self._bullet()
+        if features is not self.model.features or bullet is not self.model.bullet:
+            self.model.set_features(features, bullet)
+        self._watch(FeatureStore.path())
+
+    def _watch(self, path):
+        # Atomic saves replace the file, which drops a file watch — the folder watch catches those
+        folder = os.path.dirname(path) or "."
+        if folder not in self.watcher.directories():
+            self.watcher.addPath(folder)
+        if os.path.exists(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+
+    def _schedule_reload(self, _path=None):
+        self.reload_timer.start(150)
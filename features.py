@@ -10,22 +10,78 @@
 import os
 import json
 
+from utils.helpers import Helpers
+
 FEATURES_FILE = "features.json"
 
+DEFAULT_FEATURES = [
+    "Dark cozy theme with soft pastel accents",
+    "Drag-and-drop file area with hover feedback",
+    "Browse file button",
+    "Live progress bar during upload",
+    "Creates new Trello board with custom name",
+    "Adds paragraphs as cards in 'To Review' list",
+    "Cards named 'Note N' (pretty, customizable)",
+    "Truncates long descriptions to fit Trello limits",
+    "Success message with 'Open now?' popup",
+    "Auto-opens board in browser on confirmation",
+    "Sensitivity slider for zoom drag speed (saved)",
+    "Settings gear to change app icon (saved)",
+    "Feature list icon (📋) to view this dialog",
+    "Daily logging to trello_log_YYYY-MM-DD.txt",
+    "Graceful error handling with friendly messages",
+    "Made with one shared braincell (and zero regrets) 🧠💀",
+    "Refuses to resize (perfection needs no opinions)",
+    "Sleeps dramatically between Trello cards (0.6s of pure theater)",
+    "Has a heart icon with perfect alpha (no jagged edges allowed)",
+    "Opens an About box that proudly confesses it was made with literally one shared braincell",
+    "Logs its own existence with zero irony",
+    "Log viewer now has real-time search/filter (type to find messages instantly)",
+]
+
+
+class FeatureStore:
+    """features.json in the project root, parsed only when its mtime or size changes 🌱"""
+    _cache = {}      # path -> ((mtime_ns, size), features)
+
+    @staticmethod
+    def path() -> str:
+        return str(Helpers.get_project_root() / FEATURES_FILE)
+
+    @classmethod
+    def load(cls) -> list[str]:
+        path = cls.path()
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            try:
+                cls.save(DEFAULT_FEATURES)
+            except OSError:
+                pass
+            return list(DEFAULT_FEATURES)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = cls._cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                features = [str(item) for item in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return cached[1] if cached else []  # half-written or hand-broken: keep what we had
+        cls._cache[path] = (stamp, features)
+        return features
+
+    @classmethod
+    def save(cls, features: list[str]) -> None:
+        """Write via a temp file + rename, so readers never see a partial list."""
+        path = cls.path()
+        tmp = path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(list(features), f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+        st = os.stat(path)
+        cls._cache[path] = ((st.st_mtime_ns, st.st_size), list(features))
+
 
 def load_features() -> list[str]:
-    if not os.path.exists(FEATURES_FILE):
-        default_features = [
-            "Dark cozy theme with soft pastel accents",
-            "Drag-and-drop file area with hover feedback",
-            # ... all the others ...
-        ]
-        with open(FEATURES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(default_features, f, indent=2)
-        return default_features
-
-    try:
-        with open(FEATURES_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception:
-        return []
\ No newline at end of file
+    return FeatureStore.load()
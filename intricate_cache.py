@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - intricate_cache.py binary sidecars for quick .intricate reopens
+-The last of the board caches kept a packed copy by the door so nobody had to unfold the big one twice, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/intricate_cache.py
+import os
+import sys
+import json
+import struct
+from array import array
+
+from utils.intricate_graph import IntricateGraph, NODE_NUMBERS
+from utils.intricate_verify import read_trailer
+
+SIDECAR_SUFFIX = ".bin"          # Cushions.intricate -> .Cushions.intricate.bin (hidden, same folder)
+MAGIC = b"INTRBIN2"
+# magic, byte order, mtime_ns, size, checksum, nodes, edges, dangling, duplicates, strings bytes, doc bytes
+_HEADER = struct.Struct("<8sBqQ32sIIIIQQ")
+NO_STRING = 0xFFFFFFFF           # string-column id for "key absent" (node_tint)
+
+
+def sidecar_path(path) -> str:
+    folder, name = os.path.split(os.fspath(path))
+    return os.path.join(folder, f".{name}{SIDECAR_SUFFIX}")
+
+
+def read_checksum(path) -> bytes | None:
+    """The trailing "checksum" value, read from the last few hundred bytes only."""
+    with open(path, "rb") as f:
+        return read_trailer(f, os.fstat(f.fileno()).st_size)[0]
+
+
+def _strings_blob(strings):
+    blob = "\0".join(strings)
+    if blob.count("\0") != max(0, len(strings) - 1):
+        raise ValueError("NUL inside a string")  # can't split it back apart — skip the sidecar
+    return blob.encode("utf-8")
+
+
+def write_sidecar(path, graph: IntricateGraph, stat=None, checksum=None) -> None:
+    """Columnar dump of graph next to path; written atomically."""
+    stat = stat or os.stat(path)
+    checksum = read_checksum(path) if checksum is None else checksum
+    table, ids = [], {}
+
+    def column(values):
+        out = array("I")
+        for s in values:
+            if s is None:
+                out.append(NO_STRING)
+                continue
+            i = ids.get(s)
+            if i is None:
+                i = ids[s] = len(table)
+                table.append(s)
+            out.append(i)
+        return out
+
+    type_ids = column(graph.type_names)
+    columns = [column(graph.uuids), column(graph.titles), column(graph.labels), column(graph.bodies),
+               column(graph.tints)]
+    strings = _strings_blob(table)
+    doc = json.dumps(graph.doc, ensure_ascii=False).encode("utf-8")
+    n = len(graph)
+
+    target = sidecar_path(path)
+    tmp = target + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(
+                MAGIC, sys.byteorder == "little", stat.st_mtime_ns, stat.st_size, (checksum or b"").ljust(32, b"\0"),
+                n, graph.n_edges, graph.dangling, graph.duplicates, len(strings), len(doc),
+            ))
+            f.write(struct.pack("<I", len(type_ids)))
+            type_ids.tofile(f)
+            for name in NODE_NUMBERS:
+                getattr(graph, name).tofile(f)
+            graph.node_ids.tofile(f)
+            graph.types.tofile(f)
+            graph.flags.tofile(f)
+            for col in columns:
+                col.tofile(f)
+            graph.edge_src.tofile(f)
+            graph.edge_dst.tofile(f)
+            f.write(strings)
+            f.write(doc)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.remove(tmp)   # a half-written sidecar must not linger next to the board
+        except OSError:
+            pass
+        raise
+
+
+def read_sidecar(path, stat=None, checksum=None) -> IntricateGraph | None:
+    """The cached graph, or None when there's no sidecar or it no longer matches path."""
+    stat = stat or os.stat(path)
+    try:
+        f = open(sidecar_path(path), "rb")
+    except OSError:
+        return None
+    with f:
+        head = f.read(_HEADER.size)
+        if len(head) != _HEADER.size:
+            return None
+        magic, little, mtime_ns, size, stored_sum, n, n_edges, dangling, duplicates, n_strings, n_doc = _HEADER.unpack(head)
+        if magic != MAGIC or little != (sys.byteorder == "little"):
+            return None
+        if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        checksum = read_checksum(path) if checksum is None else checksum
+        if stored_sum.rstrip(b"\0") != (checksum or b""):
+            return None
+
+        try:
+            graph = IntricateGraph()
+            (n_types,) = struct.unpack("<I", f.read(4))
+            type_ids = _read_array(f, "I", n_types)
+            for name in NODE_NUMBERS:
+                setattr(graph, name, _read_array(f, "d", n))
+            graph.node_ids = _read_array(f, "q", n)
+            graph.types = _read_array(f, "H", n)
+            graph.flags = _read_array(f, "B", n)
+            uuid_ids, title_ids, label_ids, body_ids, tint_ids = (_read_array(f, "I", n) for _ in range(5))
+            graph.edge_src = _read_array(f, "I", n_edges)
+            graph.edge_dst = _read_array(f, "I", n_edges)
+            table = f.read(n_strings).decode("utf-8").split("\0")
+            graph.doc = json.loads(f.read(n_doc).decode("utf-8"))
+            graph.type_names = [table[i] for i in type_ids]
+            graph.uuids = [table[i] for i in uuid_ids]
+            graph.titles = [table[i] for i in title_ids]
+            graph.labels = [table[i] for i in label_ids]
+            graph.bodies = [table[i] for i in body_ids]
+            graph.tints = [None if i == NO_STRING else table[i] for i in tint_ids]
+        except (EOFError, ValueError, IndexError, struct.error):
+            return None  # truncated or damaged sidecar (a string id past the table, say) — fall back to the JSON
+
+    graph._type_ids = {name: i for i, name in enumerate(graph.type_names)}
+    graph.index = dict(zip(graph.uuids, range(n)))
+    graph.dangling = dangling
+    graph.duplicates = duplicates
+    return graph
+
+
+def _read_array(f, typecode, count):
+    out = array(typecode)
+    out.fromfile(f, count)
+    return out
+
+
+def load_graph(path) -> IntricateGraph:
+    """Open a board through its sidecar when valid; otherwise parse the JSON and rebuild the sidecar."""
+    stat = os.stat(path)
+    checksum = read_checksum(path)
+    graph = read_sidecar(path, stat, checksum)
+    if graph is not None:
+        return graph
+    graph = IntricateGraph.load(path)
+    try:
+        write_sidecar(path, graph, stat, checksum)
+    except (OSError, ValueError):
+        pass  # read-only folder or unsplittable text: the JSON path still works
+    return graph
+
+
+if __name__ == "__main__":
+    import time
+    import tempfile
+    from utils.intricate_graph import synthetic_document
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    doc = synthetic_document(n, n * 3 // 2)
+    doc["checksum"] = "0123456789abcdef"
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, "Synthetic.intricate")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+    try:
+        t0 = time.perf_counter()
+        cold = load_graph(path)
+        t1 = time.perf_counter()
+        warm = load_graph(path)
+        t2 = time.perf_counter()
+        assert warm.uuids == cold.uuids and warm.titles == cold.titles and warm.x == cold.x
+        assert warm.flags == cold.flags and warm.tints == cold.tints and warm.node_ids == cold.node_ids
+        assert list(warm.successors(0)) == list(cold.successors(0))
+        print(f"{n:,} nodes: JSON + sidecar write {t1 - t0:.3f} s, sidecar read {t2 - t1:.3f} s "
+              f"({os.path.getsize(sidecar_path(path)) / 2**20:.1f} MB sidecar)")
+    finally:
+        for p in (path, sidecar_path(path)):
+            if os.path.exists(p):
+                os.remove(p)
+        os.rmdir(folder)
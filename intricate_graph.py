@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - intricate_graph.py .intricate boards as compact, indexed graphs
+-The last of the graph loaders learned every node's name on the way in and never had to ask twice, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/intricate_graph.py
+import json
+from array import array
+
+NODE_NUMBERS = ("x", "y", "width", "height", "z_value")
+# Optional per-node booleans, two bits each in `flags`: 0 = key absent, 1 = False, 2 = True
+NODE_FLAGS = ("ports_visible", "shelf_visible", "depth_front")
+
+
+class IntricateGraph:
+    """Nodes as parallel arrays, uuid -> index map, and forward/reverse adjacency 🌱
+
+    Node i lives at position i in every column. Edges are stored once as index pairs,
+    and adjacency uses offset/target arrays (CSR), so successors(i), predecessors(i)
+    and edge resolution are O(1) lookups plus the size of the answer.
+    Connections naming a uuid that isn't on the board are counted in `dangling`
+    and left out; a node repeating an earlier node's uuid is counted in
+    `duplicates` and skipped, so the first copy is the one edges resolve to.
+    """
+
+    def __init__(self):
+        self.uuids = []
+        self.index = {}                       # uuid -> node index
+        self.x, self.y = array("d"), array("d")
+        self.width, self.height = array("d"), array("d")
+        self.z_value = array("d")
+        self.node_ids = array("q")
+        self.types = array("H")               # -> type_names
+        self.type_names = []
+        self._type_ids = {}
+        self.titles = []
+        self.labels = []
+        self.bodies = []
+        self.flags = array("B")               # NODE_FLAGS, packed
+        self.tints = []                       # node_tint, None when the node has no key
+        self.edge_src, self.edge_dst = array("I"), array("I")
+        self.dangling = 0
+        self.duplicates = 0
+        self.doc = {}                         # everything else in the file (viewport, checksum, …)
+        self._out = self._in = None
+
+    # ── loading ───────────────────────────────────────────────────
+
+    @classmethod
+    def load(cls, path) -> "IntricateGraph":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_document(json.load(f))
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "IntricateGraph":
+        graph = cls()
+        graph.doc = {k: v for k, v in doc.items() if k not in ("nodes", "connections")}
+        for node in doc.get("nodes", ()):
+            graph.add_node(node)
+        index = graph.index
+        src, dst = graph.edge_src, graph.edge_dst
+        for conn in doc.get("connections", ()):
+            a = index.get(conn.get("start_uuid"))
+            b = index.get(conn.get("end_uuid"))
+            if a is None or b is None:
+                graph.dangling += 1
+                continue
+            src.append(a)
+            dst.append(b)
+        return graph
+
+    def add_node(self, node: dict) -> int:
+        """Append a node and return its index (the existing one for a duplicate uuid)."""
+        i = len(self.uuids)
+        uuid = node.get("uuid")
+        if not uuid:
+            raise ValueError(f"node #{i + self.duplicates} has no uuid")
+        existing = self.index.get(uuid)
+        if existing is not None:
+            self.duplicates += 1
+            return existing
+        self.uuids.append(uuid)
+        self.index[uuid] = i
+        self.x.append(float(node.get("x", 0.0)))
+        self.y.append(float(node.get("y", 0.0)))
+        self.width.append(float(node.get("width", 0.0)))
+        self.height.append(float(node.get("height", 0.0)))
+        self.z_value.append(float(node.get("z_value", 0.0)))
+        self.node_ids.append(int(node.get("node_id") or 0))
+        self.types.append(self.type_id(node.get("node_type", "")))
+        self.titles.append(node.get("title") or "")
+        self.labels.append(node.get("label") or "")
+        self.bodies.append(node.get("body_text") or "")
+        packed = 0
+        for bit, name in enumerate(NODE_FLAGS):
+            value = node.get(name)
+            if value is not None:
+                packed |= (2 if value else 1) << (2 * bit)
+        self.flags.append(packed)
+        self.tints.append(node.get("node_tint"))
+        self._out = self._in = None
+        return i
+
+    def type_id(self, name: str) -> int:
+        i = self._type_ids.get(name)
+        if i is None:
+            i = self._type_ids[name] = len(self.type_names)
+            self.type_names.append(name)
+        return i
+
+    # ── lookups ───────────────────────────────────────────────────
+
+    def __len__(self):
+        return len(self.uuids)
+
+    @property
+    def n_edges(self):
+        return len(self.edge_src)
+
+    def node_type(self, i) -> str:
+        return self.type_names[self.types[i]]
+
+    def flag(self, i, name) -> bool | None:
+        """One of NODE_FLAGS for node i; None when the file didn't set it."""
+        state = (self.flags[i] >> (2 * NODE_FLAGS.index(name))) & 3
+        return None if state == 0 else state == 2
+
+    def rect(self, i):
+        return self.x[i], self.y[i], self.width[i], self.height[i]
+
+    def edge(self, k):
+        """(start index, end index) of connection k."""
+        return self.edge_src[k], self.edge_dst[k]
+
+    def resolve(self, start_uuid, end_uuid):
+        """Index pair for a connection given by uuids, or None if either end is missing."""
+        a, b = self.index.get(start_uuid), self.index.get(end_uuid)
+        return None if a is None or b is None else (a, b)
+
+    def successors(self, i):
+        offsets, targets = self._adjacency("_out")
+        return targets[offsets[i]:offsets[i + 1]]
+
+    def predecessors(self, i):
+        offsets, sources = self._adjacency("_in")
+        return sources[offsets[i]:offsets[i + 1]]
+
+    def neighbors(self, i):
+        return self.successors(i) + self.predecessors(i)
+
+    def _adjacency(self, which):
+        if self._out is None:
+            self._out = self._csr(self.edge_src, self.edge_dst)
+            self._in = self._csr(self.edge_dst, self.edge_src)
+        return getattr(self, which)
+
+    def _csr(self, keys, values):
+        # Counting sort by key: offsets[i]..offsets[i+1] are node i's slots in targets
+        n = len(self.uuids)
+        offsets = array("I", bytes(4 * (n + 1)))
+        for k in keys:
+            offsets[k + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        fill = array("I", offsets)
+        targets = array("I", bytes(4 * len(keys)))
+        for k, v in zip(keys, values):
+            targets[fill[k]] = v
+            fill[k] += 1
+        return offsets, targets
+
+
+def synthetic_document(n_nodes, n_edges, seed=7) -> dict:
+    """A board shaped like the real ones, for benchmarks."""
+    import random
+    import uuid as uuidlib
+
+    rng = random.Random(seed)
+    uuids = [uuidlib.UUID(int=rng.getrandbits(128)).hex for _ in range(n_nodes)]
+    words = ["soft", "grace", "golden", "hour", "note", "git", "commit", "koan", "tea", "warm"]
+    nodes = [
+        {
+            "node_id": 0,
+            "node_type": rng.choice(("warm", "about", "git")),
+            "title": " ".join(rng.choices(words, k=rng.randint(1, 6))),
+            "uuid": u,
+            "x": rng.uniform(-50000, 50000),
+            "y": rng.uniform(-50000, 50000),
+            "width": rng.uniform(60, 800),
+            "height": rng.uniform(25, 120),
+            "z_value": rng.uniform(-10, 10),
+            "ports_visible": False,
+            "shelf_visible": False,
+            "label": "",
+            "depth_front": False,
+            "node_tint": "",
+        }
+        for u in uuids
+    ]
+    connections = [
+        {"start_uuid": rng.choice(uuids), "end_uuid": rng.choice(uuids)} for _ in range(n_edges)
+    ]
+    return {"version": "1.0", "nodes": nodes, "connections": connections,
+            "viewport": {"camera_x": 0.0, "camera_y": 0.0, "camera_zoom": 1.0}}
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+    import tempfile
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    doc = synthetic_document(n, n * 3 // 2)
+    with tempfile.NamedTemporaryFile("w", suffix=".intricate", delete=False, encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+        path = f.name
+    try:
+        t0 = time.perf_counter()
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        t1 = time.perf_counter()
+        graph = IntricateGraph.from_document(raw)
+        t2 = time.perf_counter()
+        graph.successors(0)
+        t3 = time.perf_counter()
+        probe = [graph.resolve(c["start_uuid"], c["end_uuid"]) for c in raw["connections"][:10000]]
+        t4 = time.perf_counter()
+        print(f"{n:,} nodes, {graph.n_edges:,} edges, {os.path.getsize(path) / 2**20:.1f} MB")
+        print(f"  json parse      {t1 - t0:7.3f} s")
+        print(f"  index build     {t2 - t1:7.3f} s")
+        print(f"  adjacency build {t3 - t2:7.3f} s")
+        print(f"  resolve 10k     {(t4 - t3) * 1000:7.2f} ms  ({len(probe)} edges)")
+    finally:
+        os.remove(path)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - intricate_search.py full-text search across every .intricate board in a folder
+-The last of the notes could be found without opening a single board, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/intricate_search.py
+import os
+import json
+import math
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from typing import NamedTuple
+
+from utils.intricate_cache import load_graph
+from utils.intricate_signature import TOKEN_RE, tokens
+from utils.intricate_verify import iter_boards
+from utils.logging import AppLogger
+
+INDEX_DIR = ".index"
+INDEX_FILE = "intricate_search.json"     # manifest: board name -> mtime/size
+ENTRY_DIR = "search"                     # one postings file per board
+INDEX_VERSION = 2
+FIELD_WEIGHTS = (("titles", 2), ("labels", 2), ("bodies", 1))
+BM25_K1 = 1.2
+BM25_B = 0.75
+MIN_PREFIX = 2      # letters a word being typed needs before it expands as a prefix
+
+
+class SearchHit(NamedTuple):
+    path: str
+    uuid: str
+    title: str
+    score: float
+
+
+def index_board(path) -> dict:
+    """One board's entry: node uuids/titles/lengths plus token -> [node, weighted tf, node, tf, …]."""
+    graph = load_graph(path)
+    postings = {}
+    lengths = []
+    for i in range(len(graph)):
+        counts = Counter()
+        for field, weight in FIELD_WEIGHTS:
+            for word, n in tokens(getattr(graph, field)[i]).items():
+                counts[word] += n * weight
+        for word, n in counts.items():
+            postings.setdefault(word, []).extend((i, n))
+        lengths.append(sum(counts.values()))
+    return {"uuids": graph.uuids, "titles": graph.titles, "lengths": lengths, "postings": postings}
+
+
+def _write_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+class BoardSearchIndex:
+    """Persistent inverted index over the .intricate boards in one folder 🌱
+
+    <folder>/.index/intricate_search.json is a small manifest of each board's
+    mtime/size; the postings live in one file per board under .index/search/.
+    Opening and refresh() only read the manifest and stat the boards, re-indexing
+    just the ones that changed (through the binary sidecar when it is fresh).
+    Postings are loaded on the first search and kept merged in memory; later
+    refreshes patch only the changed boards into that map. Ranking is BM25 (titles
+    and labels count double), and the last query word matches as a prefix while
+    it is still being typed, even when it is too short to be a word of its own.
+    """
+
+    def __init__(self, folder):
+        self.folder = os.fspath(folder)
+        self.index_dir = os.path.join(self.folder, INDEX_DIR)
+        self.path = os.path.join(self.index_dir, INDEX_FILE)
+        self.manifest = {}           # board name -> {"mtime_ns", "size"}
+        self.files = {}              # board name -> entry, once loaded
+        self._loaded = False
+        self._merged = {}            # token -> {board name: flat [node, tf, …]}
+        self._df = Counter()         # token -> number of nodes containing it
+        self._vocab = None           # sorted tokens, for prefix matches; None when stale
+        self._n_docs = 0
+        self._total_len = 0
+        self._load_manifest()
+
+    # ── storage ───────────────────────────────────────────────────
+
+    def _load_manifest(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.manifest = data.get("files", {})
+
+    def _entry_path(self, name):
+        return os.path.join(self.index_dir, ENTRY_DIR, name + ".json")
+
+    def save(self) -> None:
+        os.makedirs(self.index_dir, exist_ok=True)
+        _write_json(self.path, {"version": INDEX_VERSION, "files": self.manifest})
+
+    def refresh(self) -> int:
+        """Re-index boards whose mtime or size moved; returns how many entries changed."""
+        seen, changed = set(), 0
+        for path in iter_boards(self.folder):
+            name = os.path.basename(path)
+            seen.add(name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamp = self.manifest.get(name)
+            if stamp and stamp["mtime_ns"] == st.st_mtime_ns and stamp["size"] == st.st_size:
+                continue
+            try:
+                entry = index_board(path)
+                os.makedirs(os.path.dirname(self._entry_path(name)), exist_ok=True)
+                _write_json(self._entry_path(name), entry)
+            except (OSError, ValueError, KeyError) as e:
+                AppLogger.get().warning(f"Search index skipped {name}: {e}")
+                if self._drop(name):
+                    changed += 1
+                continue
+            self._unmerge(name)
+            self.manifest[name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+            if self._loaded:
+                self._merge_in(name, entry)
+            changed += 1
+        for name in set(self.manifest) - seen:
+            self._drop(name)
+            changed += 1
+        if changed:
+            try:
+                self.save()
+            except OSError as e:
+                AppLogger.get().warning(f"Could not save search index: {e}")
+        return changed
+
+    def _drop(self, name) -> bool:
+        self._unmerge(name)
+        try:
+            os.remove(self._entry_path(name))
+        except OSError:
+            pass
+        return self.manifest.pop(name, None) is not None
+
+    # ── the merged map ────────────────────────────────────────────
+
+    def _merge_in(self, name, entry):
+        self.files[name] = entry
+        merged, df = self._merged, self._df
+        for word, flat in entry["postings"].items():
+            bucket = merged.get(word)
+            if bucket is None:
+                bucket = merged[word] = {}
+                self._vocab = None
+            bucket[name] = flat
+            df[word] += len(flat) // 2
+        self._n_docs += len(entry["lengths"])
+        self._total_len += sum(entry["lengths"])
+
+    def _unmerge(self, name):
+        entry = self.files.pop(name, None)
+        if entry is None:
+            return
+        merged, df = self._merged, self._df
+        for word, flat in entry["postings"].items():
+            bucket = merged[word]
+            del bucket[name]
+            df[word] -= len(flat) // 2
+            if not bucket:
+                del merged[word], df[word]
+                self._vocab = None
+        self._n_docs -= len(entry["lengths"])
+        self._total_len -= sum(entry["lengths"])
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        for name in list(self.manifest):
+            try:
+                with open(self._entry_path(name), "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                del self.manifest[name]   # next refresh() indexes it again
+                continue
+            self._merge_in(name, entry)
+
+    # ── searching ─────────────────────────────────────────────────
+
+    def _expand(self, word, prefix):
+        if not prefix:
+            return [word] if word in self._merged else []
+        if self._vocab is None:
+            self._vocab = sorted(self._merged)
+        start = bisect_left(self._vocab, word)
+        out = []
+        for candidate in self._vocab[start:]:
+            if not candidate.startswith(word):
+                break
+            out.append(candidate)
+        return out
+
+    def search(self, query: str, limit=20) -> list[SearchHit]:
+        """Best matching nodes across all boards, highest score first."""
+        self._ensure_loaded()
+        # No trailing space yet: the raw last word is unfinished, whether or not tokens() keeps it
+        raw = TOKEN_RE.findall(query.lower())
+        partial = raw[-1] if raw and query[-1:].isalnum() and query.lower().endswith(raw[-1]) else ""
+        typing = len(partial) >= MIN_PREFIX
+        words = [w for w in tokens(query) if w != partial]   # distinct finished words, in query order
+        if typing:
+            words.append(partial)
+        if not words:
+            return []
+        n_docs = self._n_docs
+        avg_len = self._total_len / n_docs if n_docs else 1.0
+        scores = Counter()
+        for pos, word in enumerate(words):
+            for term in self._expand(word, typing and pos == len(words) - 1):
+                df = self._df[term]
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                for name, flat in self._merged[term].items():
+                    lengths = self.files[name]["lengths"]
+                    for k in range(0, len(flat), 2):
+                        i, tf = flat[k], flat[k + 1]
+                        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[i] / avg_len)
+                        scores[(name, i)] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        # Highest score first; ties by board and node, so results don't depend on merge order
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            SearchHit(os.path.join(self.folder, name), self.files[name]["uuids"][i],
+                      self.files[name]["titles"][i], round(score, 4))
+            for (name, i), score in best
+        ]
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import shutil
+    import tempfile
+    from utils.intricate_graph import synthetic_document
+
+    if len(sys.argv) > 2 and os.path.isdir(sys.argv[1]):
+        index = BoardSearchIndex(sys.argv[1])
+        index.refresh()
+        for hit in index.search(" ".join(sys.argv[2:])):
+            print(f"{hit.score:8.3f}  {os.path.basename(hit.path)}  {hit.uuid}  {hit.title}")
+        sys.exit(0)
+
+    folder = tempfile.mkdtemp()
+    try:
+        for b in range(20):
+            doc = synthetic_document(5_000, 0, seed=b)
+            doc["nodes"][0]["title"] = f"needle haystack board {b}"
+            doc["nodes"][1]["title"] = f"software board {b}"
+            with open(os.path.join(folder, f"Board{b}.intricate"), "w", encoding="utf-8") as f:
+                json.dump(doc, f)
+        t0 = time.perf_counter()
+        index = BoardSearchIndex(folder)
+        cold = index.refresh()
+        t1 = time.perf_counter()
+        index = BoardSearchIndex(folder)   # reopen from disk: nothing should be re-read
+        warm = index.refresh()
+        t2 = time.perf_counter()
+        index.search("koan")                # first search loads and merges the postings
+        t3 = time.perf_counter()
+        for q in ("golden hour", "soft tea", "needle", "commi"):
+            index.search(q)
+        t4 = time.perf_counter()
+        hits = index.search("needle haystack")
+        assert len(hits) == 20 and all(h.title.startswith("needle") for h in hits), hits[:3]
+        assert index.search("commi")[0].score > 0
+
+        os.utime(os.path.join(folder, "Board3.intricate"), ns=(0, 0))
+        os.remove(os.path.join(folder, "Board4.intricate"))
+        t5 = time.perf_counter()
+        assert index.refresh() == 2 and len(index.search("needle", limit=50)) == 19
+        t6 = time.perf_counter()
+        assert index.search("soft ") and all(not h.title.startswith("software") for h in index.search("soft "))
+        assert index.search("soft an") and all(not h.title.startswith("software") for h in index.search("soft an"))
+        assert index.search("softw")[0].title.startswith("software")
+        assert all(h.title.startswith("needle haystack") for h in index.search("needle ha", limit=19))
+        fresh = BoardSearchIndex(folder)
+        assert fresh.refresh() == 0 and fresh.search("needle haystack", limit=50) == index.search("needle haystack", limit=50)
+
+        print(f"20 boards x 5,000 nodes: index {t1 - t0:.2f} s ({cold} boards), "
+              f"reopen + refresh {(t2 - t1) * 1000:.1f} ms ({warm} re-read), "
+              f"first search {(t3 - t2) * 1000:.0f} ms, then {(t4 - t3) * 1000 / 4:.1f} ms per query, "
+              f"2-board refresh + search {(t6 - t5) * 1000:.0f} ms")
+    finally:
+        shutil.rmtree(folder)
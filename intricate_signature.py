@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - intricate_signature.py the board's description_signature, kept current as it changes
+-The last of the board summaries was never rewritten from scratch, only gently amended, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/intricate_signature.py
+import re
+import heapq
+from collections import Counter
+
+TAG_BAG_SIZE = 24
+TOKEN_RE = re.compile(r"[a-z][a-z0-9']*[a-z0-9]|[a-z]")
+MIN_TOKEN = 3
+STOPWORDS = frozenset("""
+    the and for are but not you your with this that from have has had was were will would
+    can could should its it's into onto over under than then them they their there these those
+    what when where which who whom why how all any each every some such only own same very
+    just also out about after before again once here more most other off too our ours she her
+    his him himself herself itself ourselves yourself yourselves being been does did doing
+""".split())
+
+
+def tokens(text: str) -> Counter:
+    """Tag-worthy words of one text: lowercase, at least MIN_TOKEN letters, no stopwords."""
+    return Counter(
+        w for w in TOKEN_RE.findall(text.lower())
+        if len(w) >= MIN_TOKEN and w not in STOPWORDS
+    )
+
+
+def node_tokens(node: dict) -> Counter:
+    return tokens(node.get("title") or "") + tokens(node.get("body_text") or "")  # null fields count as empty
+
+
+def _signature(n_nodes, n_edges, type_counts, token_counts) -> dict:
+    # Most frequent tokens first; ties go alphabetically so the bag is deterministic
+    bag = heapq.nsmallest(TAG_BAG_SIZE, ((-c, w) for w, c in token_counts.items() if c > 0))
+    return {
+        "n_nodes": n_nodes,
+        "n_edges": n_edges,
+        "density": round(n_edges / n_nodes, 3) if n_nodes else 0.0,
+        "type_hist": {
+            t: round(c / n_nodes, 3)
+            for t, c in sorted(type_counts.items(), key=lambda item: (-item[1], item[0])) if c > 0
+        },
+        "tag_bag": [w for _, w in bag],
+    }
+
+
+def full_signature(doc: dict) -> dict:
+    """Recompute description_signature from scratch (the reference the engine must match)."""
+    nodes = doc.get("nodes", ())
+    uuids = {n["uuid"] for n in nodes}
+    n_edges = sum(
+        1 for c in doc.get("connections", ())
+        if c.get("start_uuid") in uuids and c.get("end_uuid") in uuids
+    )
+    type_counts = Counter(n.get("node_type", "") for n in nodes)
+    token_counts = Counter()
+    for n in nodes:
+        token_counts.update(node_tokens(n))
+    return _signature(len(nodes), n_edges, type_counts, token_counts)
+
+
+class SignatureEngine:
+    """Keeps description_signature current under node/connection edits 🌱
+
+    Counts live per node, so an edit costs O(size of the changed text): only the
+    old and new token counts of that node are diffed into the board totals. The
+    signature dict itself is rebuilt on demand (a top-k over the vocabulary) and
+    cached until the next change.
+    """
+
+    def __init__(self):
+        self.node_type = {}          # uuid -> node_type
+        self.node_tokens = {}        # uuid -> Counter
+        self.type_counts = Counter()
+        self.token_counts = Counter()
+        self.incident = {}           # uuid -> Counter of (start, end) edges touching it
+        self.n_edges = 0
+        self._cached = None
+
+    @classmethod
+    def from_document(cls, doc: dict) -> "SignatureEngine":
+        engine = cls()
+        for node in doc.get("nodes", ()):
+            engine.add_node(node)
+        for conn in doc.get("connections", ()):
+            if conn.get("start_uuid") in engine.node_type and conn.get("end_uuid") in engine.node_type:
+                engine.add_connection(conn["start_uuid"], conn["end_uuid"])
+        return engine
+
+    # ── nodes ─────────────────────────────────────────────────────
+
+    def add_node(self, node: dict) -> None:
+        uuid = node["uuid"]
+        if uuid in self.node_type:
+            raise KeyError(f"node {uuid} already exists")
+        self.node_type[uuid] = node.get("node_type", "")
+        self.type_counts[self.node_type[uuid]] += 1
+        counts = node_tokens(node)
+        self.node_tokens[uuid] = counts
+        self.token_counts.update(counts)
+        self.incident[uuid] = Counter()
+        self._cached = None
+
+    def update_node(self, uuid, node_type=None, title=None, body_text=None, old_title=None, old_body_text=None):
+        """Apply an edit. Pass the changed fields; for text, old_* lets the diff skip untouched parts.
+
+        Without old_* the node's stored counts are replaced wholesale, which needs both
+        the new title and body_text (whatever didn't change, pass unchanged).
+        """
+        if node_type is not None and node_type != self.node_type[uuid]:
+            self._drop_type(self.node_type[uuid])
+            self.type_counts[node_type] += 1
+            self.node_type[uuid] = node_type
+            self._cached = None
+        if title is None and body_text is None:
+            return
+        counts = self.node_tokens[uuid]
+        if old_title is not None or old_body_text is not None:
+            removed = tokens(old_title or "") + tokens(old_body_text or "")
+            added = tokens(title or "") + tokens(body_text or "")
+            fresh = counts.copy()
+            fresh.subtract(removed)
+            fresh.update(added)
+            fresh = +fresh
+        else:
+            fresh = tokens(title or "") + tokens(body_text or "")
+        self._swap_tokens(counts, fresh)
+        self.node_tokens[uuid] = fresh
+
+    def remove_node(self, uuid) -> None:
+        """Remove a node together with every connection touching it."""
+        for (a, b), count in list(self.incident[uuid].items()):
+            for _ in range(count):
+                self.remove_connection(a, b)
+        self._drop_type(self.node_type.pop(uuid))
+        self._swap_tokens(self.node_tokens.pop(uuid), Counter())
+        del self.incident[uuid]
+        self._cached = None
+
+    def _drop_type(self, node_type):
+        # Counters keep only live entries, so the engine's state equals a fresh build's
+        self.type_counts[node_type] -= 1
+        if not self.type_counts[node_type]:
+            del self.type_counts[node_type]
+
+    def _swap_tokens(self, old, new):
+        for w in old.keys() | new.keys():
+            delta = new.get(w, 0) - old.get(w, 0)
+            if delta:
+                self.token_counts[w] += delta
+                if self.token_counts[w] <= 0:
+                    del self.token_counts[w]
+                self._cached = None
+
+    # ── connections ───────────────────────────────────────────────
+
+    def add_connection(self, start_uuid, end_uuid) -> None:
+        edge = (start_uuid, end_uuid)
+        self.incident[start_uuid][edge] += 1
+        if end_uuid != start_uuid:
+            self.incident[end_uuid][edge] += 1
+        self.n_edges += 1
+        self._cached = None
+
+    def remove_connection(self, start_uuid, end_uuid) -> None:
+        edge = (start_uuid, end_uuid)
+        if not self.incident.get(start_uuid, {}).get(edge):
+            raise KeyError(f"no connection {start_uuid} -> {end_uuid}")
+        for uuid in {start_uuid, end_uuid}:
+            self.incident[uuid][edge] -= 1
+            if not self.incident[uuid][edge]:
+                del self.incident[uuid][edge]
+        self.n_edges -= 1
+        self._cached = None
+
+    # ── output ────────────────────────────────────────────────────
+
+    def signature(self) -> dict:
+        if self._cached is None:
+            self._cached = _signature(len(self.node_type), self.n_edges, self.type_counts, self.token_counts)
+        return self._cached
+
+
+if __name__ == "__main__":
+    # Property check: random edit sequences must always agree with a full recompute
+    import sys
+    import json
+    import random
+    import uuid as uuidlib
+
+    rng = random.Random(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
+    words = "soft grace golden hour note git commit koan tea warm the and bright tomorrow era".split()
+
+    def text():
+        return " ".join(rng.choices(words, k=rng.randint(0, 8)))
+
+    def node():
+        return {"uuid": uuidlib.UUID(int=rng.getrandbits(128)).hex, "node_type": rng.choice(("warm", "about", "git")),
+                "title": text() if rng.random() < 0.9 else None, "body_text": text()}
+
+    doc = {"nodes": [], "connections": []}
+    engine = SignatureEngine()
+    checks = 0
+    for step in range(3000):
+        op = rng.random()
+        nodes = doc["nodes"]
+        if op < 0.3 or len(nodes) < 2:
+            n = node()
+            nodes.append(n)
+            engine.add_node(n)
+        elif op < 0.5:
+            n = rng.choice(nodes)
+            old_title, old_body = n["title"], n["body_text"]
+            n["title"], n["body_text"] = text(), text()
+            if rng.random() < 0.5:
+                engine.update_node(n["uuid"], title=n["title"], body_text=n["body_text"],
+                                   old_title=old_title, old_body_text=old_body)
+            else:
+                engine.update_node(n["uuid"], title=n["title"], body_text=n["body_text"])
+        elif op < 0.6:
+            n = rng.choice(nodes)
+            n["node_type"] = rng.choice(("warm", "about", "git", "koan"))
+            engine.update_node(n["uuid"], node_type=n["node_type"])
+        elif op < 0.8:
+            a, b = rng.choice(nodes)["uuid"], rng.choice(nodes)["uuid"]
+            doc["connections"].append({"start_uuid": a, "end_uuid": b})
+            engine.add_connection(a, b)
+        elif op < 0.9 and doc["connections"]:
+            conn = doc["connections"].pop(rng.randrange(len(doc["connections"])))
+            engine.remove_connection(conn["start_uuid"], conn["end_uuid"])
+        else:
+            n = nodes.pop(rng.randrange(len(nodes)))
+            doc["connections"] = [c for c in doc["connections"] if n["uuid"] not in (c["start_uuid"], c["end_uuid"])]
+            engine.remove_node(n["uuid"])
+        expected = full_signature(doc)
+        got = engine.signature()
+        fresh = SignatureEngine.from_document(doc)
+        # Plain dicts: Counter equality would overlook leftover zero entries
+        assert (dict(engine.type_counts), dict(engine.token_counts)) == (dict(fresh.type_counts), dict(fresh.token_counts)), step
+        if got != expected:
+            print(f"mismatch at step {step}:\n{json.dumps(got, indent=1)}\n{json.dumps(expected, indent=1)}")
+            sys.exit(1)
+        checks += 1
+    print(f"{checks} random edits, incremental signature matched full recompute every time")
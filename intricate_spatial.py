@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - intricate_spatial.py where everything sits on a .intricate canvas
+-The last of the canvases knew which cushions were in the room without walking all of them, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/intricate_spatial.py
+import math
+from itertools import chain
+from statistics import median
+
+from utils.intricate_graph import IntricateGraph
+
+MIN_CELL = 64.0
+MAX_NODE_CELLS = 64      # nodes spanning more cells than this live in the oversized set instead
+
+
+def viewport_rect(viewport: dict, view_width, view_height):
+    """Scene rect seen by a view of the given pixel size.
+
+    camera_x/camera_y are taken as the scene point at the view's centre, and
+    camera_zoom as pixels per scene unit.
+    """
+    zoom = viewport.get("camera_zoom") or 1.0
+    half_w, half_h = view_width / zoom / 2, view_height / zoom / 2
+    cx, cy = viewport.get("camera_x", 0.0), viewport.get("camera_y", 0.0)
+    return cx - half_w, cy - half_h, cx + half_w, cy + half_h
+
+
+class SpatialIndex:
+    """Uniform grid over an IntricateGraph's node rects, for culling and hit-testing 🌱
+
+    Each node is filed under every cell its rect (x, y, width, height; x/y top-left)
+    overlaps. The cell size defaults to twice the median node extent, so a typical
+    node sits in one to four cells and both queries cost O(cells touched + hits).
+    A node covering more than MAX_NODE_CELLS cells (a giant backdrop, say) is kept
+    in a small `oversized` set that every query checks directly, so it never costs
+    millions of cells to file or move. Call move() (or set_z()) whenever a node
+    changes, and add() after appending one to the graph.
+    """
+
+    def __init__(self, graph: IntricateGraph, cell=None):
+        self.graph = graph
+        if cell is None:
+            extents = [max(w, h) for w, h in zip(graph.width, graph.height)]
+            cell = 2 * median(extents) if extents else MIN_CELL
+        self.cell = max(float(cell), MIN_CELL)
+        self.cells = {}          # (col, row) -> set of node indices
+        self.spans = []          # node index -> (col0, row0, col1, row1)
+        self.oversized = set()   # node indices too big to file cell by cell
+        for i in range(len(graph)):
+            self.add(i)
+
+    # ── upkeep ────────────────────────────────────────────────────
+
+    def _span(self, i):
+        g, c = self.graph, self.cell
+        x, y = g.x[i], g.y[i]
+        return (math.floor(x / c), math.floor(y / c),
+                math.floor((x + g.width[i]) / c), math.floor((y + g.height[i]) / c))
+
+    def _file(self, i, span, add):
+        c0, r0, c1, r1 = span
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > MAX_NODE_CELLS:
+            if add:
+                self.oversized.add(i)
+            else:
+                self.oversized.discard(i)
+            return
+        cells = self.cells
+        for col in range(c0, c1 + 1):
+            for row in range(r0, r1 + 1):
+                if add:
+                    cells.setdefault((col, row), set()).add(i)
+                else:
+                    bucket = cells[(col, row)]
+                    bucket.discard(i)
+                    if not bucket:
+                        del cells[(col, row)]
+
+    def add(self, i) -> None:
+        span = self._span(i)
+        if i == len(self.spans):
+            self.spans.append(span)
+        else:
+            self.spans[i] = span
+        self._file(i, span, True)
+
+    def move(self, i, x, y, width=None, height=None) -> None:
+        """Update node i's geometry in the graph and re-file it if its cells changed."""
+        g = self.graph
+        g.x[i], g.y[i] = x, y
+        if width is not None:
+            g.width[i] = width
+        if height is not None:
+            g.height[i] = height
+        old, new = self.spans[i], self._span(i)
+        if old != new:
+            self._file(i, old, False)
+            self._file(i, new, True)
+            self.spans[i] = new
+
+    def set_z(self, i, z) -> None:
+        self.graph.z_value[i] = z   # z only matters when ordering hits, no re-filing needed
+
+    # ── queries ───────────────────────────────────────────────────
+
+    def _candidates(self, x0, y0, x1, y1):
+        c = self.cell
+        c0, r0 = math.floor(x0 / c), math.floor(y0 / c)
+        c1, r1 = math.floor(x1 / c), math.floor(y1 / c)
+        found = set(self.oversized)
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > len(self.cells):
+            # Zoomed far out: fewer occupied cells than cells in range
+            for (col, row), bucket in self.cells.items():
+                if c0 <= col <= c1 and r0 <= row <= r1:
+                    found |= bucket
+        else:
+            cells = self.cells
+            for col in range(c0, c1 + 1):
+                for row in range(r0, r1 + 1):
+                    bucket = cells.get((col, row))
+                    if bucket:
+                        found |= bucket
+        return found
+
+    def query(self, x0, y0, x1, y1) -> list[int]:
+        """Nodes whose rect intersects the scene rect, in paint order (lowest z first)."""
+        g = self.graph
+        xs, ys, ws, hs, zs = g.x, g.y, g.width, g.height, g.z_value
+        hits = [
+            i for i in self._candidates(x0, y0, x1, y1)
+            if xs[i] <= x1 and xs[i] + ws[i] >= x0 and ys[i] <= y1 and ys[i] + hs[i] >= y0
+        ]
+        hits.sort(key=lambda i: (zs[i], i))
+        return hits
+
+    def visible(self, view_width, view_height, viewport=None) -> list[int]:
+        """Nodes on screen for the document's stored viewport (or the one given)."""
+        viewport = self.graph.doc.get("viewport", {}) if viewport is None else viewport
+        return self.query(*viewport_rect(viewport, view_width, view_height))
+
+    def topmost_at(self, px, py) -> int | None:
+        """The node drawn on top at a scene point (highest z, later node on ties), or None."""
+        c = self.cell
+        bucket = self.cells.get((math.floor(px / c), math.floor(py / c)), ())
+        g = self.graph
+        best, best_key = None, None
+        for i in chain(bucket, self.oversized):
+            if g.x[i] <= px <= g.x[i] + g.width[i] and g.y[i] <= py <= g.y[i] + g.height[i]:
+                key = (g.z_value[i], i)
+                if best_key is None or key > best_key:
+                    best, best_key = i, key
+        return best
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import random
+    from utils.intricate_graph import synthetic_document
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(3)
+    graph = IntricateGraph.from_document(synthetic_document(n, 0))
+    t0 = time.perf_counter()
+    index = SpatialIndex(graph)
+    t1 = time.perf_counter()
+
+    def scan_query(x0, y0, x1, y1):
+        g = graph
+        hits = [i for i in range(len(g)) if g.x[i] <= x1 and g.x[i] + g.width[i] >= x0
+                and g.y[i] <= y1 and g.y[i] + g.height[i] >= y0]
+        return sorted(hits, key=lambda i: (g.z_value[i], i))
+
+    def scan_topmost(px, py):
+        g = graph
+        hits = [i for i in range(len(g)) if g.x[i] <= px <= g.x[i] + g.width[i] and g.y[i] <= py <= g.y[i] + g.height[i]]
+        return max(hits, key=lambda i: (g.z_value[i], i)) if hits else None
+
+    # Shuffle a tenth of the nodes around (a few into giant backdrops), then check both queries against full scans
+    t2 = time.perf_counter()
+    for _ in range(n // 10):
+        i = rng.randrange(n)
+        index.move(i, rng.uniform(-50000, 50000), rng.uniform(-50000, 50000), rng.uniform(60, 800))
+    for i in range(5):
+        index.move(i, -1e6, -1e6, 2e6, 2e6)
+    t3 = time.perf_counter()
+    for _ in range(20):
+        x, y = rng.uniform(-50000, 50000), rng.uniform(-50000, 50000)
+        viewport = {"camera_x": x, "camera_y": y, "camera_zoom": rng.choice((0.05, 0.5, 1.0, 2.0))}
+        assert index.visible(1920, 1080, viewport) == scan_query(*viewport_rect(viewport, 1920, 1080))
+        assert index.topmost_at(x, y) == scan_topmost(x, y)
+
+    points = [(rng.uniform(-50000, 50000), rng.uniform(-50000, 50000)) for _ in range(1000)]
+    t4 = time.perf_counter()
+    shown = sum(len(index.visible(1920, 1080, {"camera_x": x, "camera_y": y, "camera_zoom": 0.7})) for x, y in points)
+    t5 = time.perf_counter()
+    for x, y in points:
+        index.topmost_at(x, y)
+    t6 = time.perf_counter()
+    scan_query(*viewport_rect({"camera_x": 0, "camera_y": 0, "camera_zoom": 0.7}, 1920, 1080))
+    t7 = time.perf_counter()
+
+    print(f"{n:,} nodes, cell {index.cell:.0f}, {len(index.cells):,} occupied cells, {len(index.oversized)} oversized")
+    print(f"  build            {t1 - t0:7.3f} s")
+    print(f"  {n // 10:,} moves     {t3 - t2:7.3f} s")
+    print(f"  viewport query   {(t5 - t4) * 1000 / len(points):7.3f} ms avg ({shown / len(points):.0f} nodes each)")
+    print(f"  topmost at point {(t6 - t5) * 1000 / len(points):7.3f} ms avg")
+    print(f"  full-scan query  {(t7 - t6) * 1000:7.1f} ms")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - intricate_verify.py streaming integrity checks for .intricate boards
+-The last of the board checks read every page once, quickly, and never had to unfold the whole thing, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/intricate_verify.py
+import os
+import re
+import json
+import codecs
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK = 1 << 20
+VERIFY_THREADS = 4
+EXTENSION = ".intricate"
+_TAIL = 256
+# Optional comma + "checksum": "<hex>" + closing brace, at the very end of the file
+_TRAILER_RE = re.compile(rb'\s*,?\s*"checksum"\s*:\s*"([0-9a-fA-F]{0,32})"\s*}\s*$')
+_CLOSED_RE = re.compile(rb'}\s*$')
+_ZERO_RUN = b"\0" * 16           # a block of NULs: the classic trace of a write cut short by power loss
+
+# The writer's checksum, as a factory for a hashlib-style object fed every byte before the
+# trailer. Its algorithm isn't known in this tree, so stored checksums are reported as
+# "unverified" rather than judged; plug the real one in here and "ok"/"mismatch" follow.
+BOARD_CHECKSUM = None
+
+
+class VerifyResult(NamedTuple):
+    path: str
+    state: str          # "ok" | "unverified" | "unsigned" | "mismatch" | "truncated" | "corrupt" | "unreadable"
+    message: str
+    stored: str = ""
+    computed: str = ""
+
+    @property
+    def sound(self) -> bool:
+        """Structurally intact and safe to hand to json.load."""
+        return self.state in ("ok", "unverified", "unsigned")
+
+
+def read_trailer(f, size) -> tuple[bytes | None, int]:
+    """(stored checksum, offset where the checksummed body ends) from the file's last bytes.
+
+    The checksum is None when the file has no trailer; the offset is then the file size.
+    """
+    start = max(0, size - _TAIL)
+    f.seek(start)
+    m = _TRAILER_RE.search(f.read())
+    if m is None:
+        return None, size
+    return m.group(1), start + m.start()
+
+
+def _scan_body(f, body_end, hasher):
+    """Stream the body once; returns a problem description or None."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    f.seek(0)
+    remaining, offset, carry = body_end, 0, b""
+    while remaining:
+        chunk = f.read(min(CHUNK, remaining))
+        if not chunk:
+            return "truncated", "file shrank while reading"
+        window = carry + chunk
+        if _ZERO_RUN in window:
+            return "corrupt", f"run of NUL bytes near offset {offset - len(carry) + window.index(_ZERO_RUN)}"
+        try:
+            decoder.decode(chunk)
+        except UnicodeDecodeError:
+            return "corrupt", f"invalid UTF-8 in the block at offset {offset}"
+        if hasher is not None:
+            hasher.update(chunk)
+        carry = chunk[-(len(_ZERO_RUN) - 1):]
+        remaining -= len(chunk)
+        offset += len(chunk)
+    return None
+
+
+def verify_file(path) -> VerifyResult:
+    """Check one board in a single bounded-memory pass, before anyone pays for json.load.
+
+    The gate is structural: it starts like a board, ends with the checksum trailer,
+    and the bytes in between hold no NUL-filled holes or broken UTF-8. The stored
+    checksum itself can only be judged once BOARD_CHECKSUM is known.
+    """
+    path = os.fspath(path)
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            head = f.read(64).lstrip()
+            if not head.startswith(b"{"):
+                if not head:
+                    return VerifyResult(path, "truncated", "empty file")
+                return VerifyResult(path, "corrupt", "not a board (doesn't start with '{')")
+            stored, body_end = read_trailer(f, size)
+            if stored is None:
+                return _verify_unsigned(f, path, size)
+            hasher = BOARD_CHECKSUM() if BOARD_CHECKSUM is not None else None
+            problem = _scan_body(f, body_end, hasher)
+    except OSError as e:
+        return VerifyResult(path, "unreadable", str(e))
+
+    stored = stored.decode("ascii").lower()
+    if problem is not None:
+        return VerifyResult(path, problem[0], problem[1], stored)
+    if hasher is None:
+        return VerifyResult(path, "unverified", "intact; checksum algorithm unknown, not checked", stored)
+    computed = hasher.hexdigest()
+    if stored != computed:
+        return VerifyResult(path, "mismatch", "checksum doesn't match contents", stored, computed)
+    return VerifyResult(path, "ok", "", stored, computed)
+
+
+def _verify_unsigned(f, path, size) -> VerifyResult:
+    # Boards the app saves always end with the trailer, so this is either an old board or a
+    # cut-off one. A closing '}' may just close a node, so only a full parse can tell them apart.
+    f.seek(max(0, size - _TAIL))
+    if not _CLOSED_RE.search(f.read()):
+        return VerifyResult(path, "truncated", "file ends mid-document (partial write?)")
+    f.seek(0)
+    try:
+        json.load(f)
+    except (ValueError, UnicodeDecodeError) as e:
+        return VerifyResult(path, "truncated", f"no checksum and the document doesn't close ({e})")
+    return VerifyResult(path, "unsigned", "no checksum field")
+
+
+def iter_boards(folder):
+    for entry in os.scandir(folder):
+        if entry.is_file() and entry.name.endswith(EXTENSION):
+            yield entry.path
+
+
+def verify_directory(folder, threads=VERIFY_THREADS):
+    """Verify every board in folder on a small thread pool; yields results as they finish.
+
+    File reads and the UTF-8 check run in C without the GIL, so threads overlap disk I/O.
+    """
+    paths = sorted(iter_boards(folder))
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="verify") as pool:
+        yield from pool.map(verify_file, paths)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    import shutil
+    import tempfile
+    from utils.intricate_graph import synthetic_document
+
+    if len(sys.argv) > 1 and os.path.isdir(sys.argv[1]):
+        for result in verify_directory(sys.argv[1]):
+            print(f"{result.state:10} {os.path.basename(result.path)} {result.message}")
+        sys.exit(0)
+
+    folder = tempfile.mkdtemp()
+    try:
+        paths = []
+        for i in range(8):
+            path = os.path.join(folder, f"Board{i}.intricate")
+            doc = synthetic_document(25_000, 37_000, seed=i)
+            doc["checksum"] = "b4efafcb74d4c1d8"   # shaped like the writer's, algorithm unknown
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(doc, f, indent=2)
+            paths.append(path)
+        total = sum(os.path.getsize(p) for p in paths)
+
+        # Damage a few copies the ways real files go wrong
+        with open(paths[1], "r+b") as f:
+            f.seek(100_000)
+            f.write(b"\0" * 4096)          # unflushed block after a crash
+        with open(paths[2], "r+b") as f:
+            f.truncate(os.path.getsize(paths[2]) // 2)
+        with open(paths[3], "rb") as f:
+            raw = f.read()
+        with open(paths[3], "wb") as f:
+            f.write(_TRAILER_RE.sub(b"\n}", raw))
+        with open(paths[4], "r+b") as f:
+            f.truncate(raw.index(b"}", 5000) + 1)   # cut right after a node's closing brace
+        with open(paths[5], "r+b") as f:
+            f.seek(200_000)
+            f.write(b"\xff\xfe")
+
+        t0 = time.perf_counter()
+        results = {os.path.basename(r.path): r.state for r in verify_directory(folder)}
+        t1 = time.perf_counter()
+        for path in paths:
+            try:
+                with open(path, "rb") as f:
+                    json.load(f)
+            except ValueError:
+                pass
+        t2 = time.perf_counter()
+
+        expected = {"Board1.intricate": "corrupt", "Board2.intricate": "truncated", "Board3.intricate": "unsigned",
+                    "Board4.intricate": "truncated", "Board5.intricate": "corrupt"}
+        for name, state in sorted(results.items()):
+            assert state == expected.get(name, "unverified"), (name, state)
+        print(f"{len(paths)} boards, {total / 2**20:.0f} MB: verify {t1 - t0:.3f} s "
+              f"({total / 2**20 / (t1 - t0):.0f} MB/s), json.load {t2 - t1:.3f} s")
+        print("  " + ", ".join(f"{n}={s}" for n, s in sorted(results.items())))
+    finally:
+        shutil.rmtree(folder)
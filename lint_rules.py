@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - lint_rules.py gentle proofreading checks for card text
+-The last of the proofreaders pointed at the doubled word and said nothing unkind about it, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# Pure functions only — this module is what the lint worker processes import, so keep it Qt-free.
+import re
+import hashlib
+
+MAX_SENTENCE_WORDS = 40
+
+REPEATED_WORD_RE = re.compile(r"\b(\w+)\s+\1\b", re.IGNORECASE)
+DOUBLE_SPACE_RE = re.compile(r"(?<=\S) {2,}(?=\S)")
+SENTENCE_RE = re.compile(r"[^.!?]+[.!?]*")
+PASSIVE_RE = re.compile(
+    r"\b(am|is|are|was|were|be|been|being)\s+(\w+ed|\w+en|made|done|seen|told|found|known|held|kept|left|built|sent|taught|thought|brought|bought|caught|put|set|cut|read)\b",
+    re.IGNORECASE,
+)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def lint_text(text: str) -> list[tuple[str, str]]:
+    """All issues in one card as (rule, message) pairs, in reading order per rule."""
+    issues = []
+
+    for m in REPEATED_WORD_RE.finditer(text):
+        issues.append(("repeated-word", f"Repeated word: “{m.group(0)}”"))
+
+    for sentence in SENTENCE_RE.findall(text):
+        words = len(sentence.split())
+        if words > MAX_SENTENCE_WORDS:
+            issues.append(("long-sentence", f"Long sentence ({words} words): “{sentence.strip()[:40]}…”"))
+
+    doubled = len(DOUBLE_SPACE_RE.findall(text))
+    if doubled:
+        issues.append(("double-space", f"{doubled} doubled space(s)"))
+
+    has_curly = "“" in text or "”" in text
+    if '"' in text and has_curly:
+        issues.append(("mixed-quotes", "Straight and curly double quotes are mixed"))
+    elif text.count("“") != text.count("”"):
+        issues.append(("mixed-quotes", "Unbalanced curly quotes"))
+    elif text.count('"') % 2:
+        issues.append(("mixed-quotes", "Unbalanced straight quotes"))
+
+    for m in PASSIVE_RE.finditer(text):
+        issues.append(("passive", f"Passive voice? “{m.group(0)}”"))
+
+    return issues
+
+
+def lint_batch(items: list[tuple[str, str]]) -> list[tuple[str, list[tuple[str, str]]]]:
+    """Worker entry point: [(hash, text)] in, [(hash, issues)] out."""
+    return [(h, lint_text(text)) for h, text in items]
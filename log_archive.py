@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - log_archive.py old daily logs, squeezed into seekable blocks
+-The last of the log archives folded each old day into small boxes and labelled every one, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/log_archive.py
+import os
+import zlib
+import struct
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+
+ARCHIVE_EXT = ".blkz"          # appended to the log's own name: cushions_2026-10-01.log.blkz
+MAGIC = b"CUSHLZ01"
+BLOCK_SIZE = 1024 * 1024       # uncompressed bytes per block (cut back to the last line end)
+CACHED_BLOCKS = 8
+_ENTRY = struct.Struct("<QQI")         # raw offset, compressed offset, compressed length
+_TRAILER = struct.Struct("<QIQ8s")     # index offset, block count, raw size, magic
+
+# Layout: MAGIC | zlib block … | index entries | trailer. Blocks always hold whole
+# lines, so any block can be decompressed and parsed on its own.
+
+
+def write_archive(src_path, dst_path, block_size=BLOCK_SIZE, level=6):
+    """Compress src_path into a block archive at dst_path (written atomically)."""
+    tmp = dst_path + ".tmp"
+    entries = []
+    raw_offset = 0
+    try:
+        with open(src_path, "rb") as src, open(tmp, "wb") as dst:
+            dst.write(MAGIC)
+            carry = b""
+            while True:
+                data = src.read(block_size)
+                block = carry + data
+                if not block:
+                    break
+                if data:
+                    cut = block.rfind(b"\n", 0, block_size) + 1 or len(block)
+                    block, carry = block[:cut], block[cut:]
+                else:
+                    carry = b""
+                packed = zlib.compress(block, level)
+                entries.append((raw_offset, dst.tell(), len(packed)))
+                dst.write(packed)
+                raw_offset += len(block)
+            index_offset = dst.tell()
+            for entry in entries:
+                dst.write(_ENTRY.pack(*entry))
+            dst.write(_TRAILER.pack(index_offset, len(entries), raw_offset, MAGIC))
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp, dst_path)
+    except BaseException:
+        try:
+            os.remove(tmp)   # a half-written archive must not linger for the next pass
+        except OSError:
+            pass
+        raise
+
+
+class BlockArchive:
+    """Read-only, random-access view of a block archive 🌱
+
+    Behaves enough like bytes for LogIndex: len(), slicing, find/rfind and
+    iter_chunks(). Only the blocks a read touches get decompressed, and the last
+    few stay cached, so paging around an old day is cheap.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        try:
+            self._file.seek(-_TRAILER.size, os.SEEK_END)
+            index_offset, count, self.size, magic = _TRAILER.unpack(self._file.read(_TRAILER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a log archive")
+            self._file.seek(index_offset)
+            raw = self._file.read(count * _ENTRY.size)
+        except Exception:
+            self._file.close()
+            raise
+        entries = [_ENTRY.unpack_from(raw, i * _ENTRY.size) for i in range(count)]
+        self.raw_offsets = [e[0] for e in entries]
+        self._spans = [(e[1], e[2]) for e in entries]
+
+    def __len__(self):
+        return self.size
+
+    def _block(self, k):
+        with self._lock:
+            block = self._cache.get(k)
+            if block is not None:
+                self._cache.move_to_end(k)
+                return block
+            offset, length = self._spans[k]
+            self._file.seek(offset)
+            packed = self._file.read(length)
+        block = zlib.decompress(packed)
+        with self._lock:
+            self._cache[k] = block
+            if len(self._cache) > CACHED_BLOCKS:
+                self._cache.popitem(last=False)
+        return block
+
+    def iter_chunks(self, lo, hi):
+        """(offset, block bytes) for every block overlapping [lo, hi)."""
+        if lo >= hi:
+            return
+        k = max(0, bisect_right(self.raw_offsets, lo) - 1)
+        while k < len(self.raw_offsets) and self.raw_offsets[k] < hi:
+            yield self.raw_offsets[k], self._block(k)
+            k += 1
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("BlockArchive only supports contiguous slices")
+        lo, hi, _ = key.indices(self.size)
+        return b"".join(
+            block[max(0, lo - base):hi - base] for base, block in self.iter_chunks(lo, hi)
+        )
+
+    def find(self, sub, start=0, end=None):
+        end = self.size if end is None else end
+        for base, block in self.iter_chunks(start, end):
+            # Needles here are single separators (b"\n"), so they never straddle blocks
+            i = block.find(sub, max(0, start - base), end - base)
+            if i >= 0:
+                return base + i
+        return -1
+
+    def rfind(self, sub, start=0, end=None):
+        end = self.size if end is None else end
+        k = bisect_right(self.raw_offsets, end - 1) - 1
+        while k >= 0 and start < end:
+            base = self.raw_offsets[k]
+            i = self._block(k).rfind(sub, max(0, start - base), end - base)
+            if i >= 0:
+                return base + i
+            if base <= start:
+                break
+            k -= 1
+        return -1
+
+    def close(self):
+        self._cache.clear()
+        self._file.close()
+
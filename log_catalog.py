@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - log_catalog.py every daily log, summarised and searchable at once
+-The last of the log catalogues remembered what each old day was about and only opened the ones that mattered, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/log_catalog.py
+import os
+import re
+import json
+from array import array
+from datetime import date, datetime, timedelta
+
+from utils.log_index import LogIndex, MappedLog, LEVELS, SCAN_CHUNK
+from utils.log_archive import BlockArchive, ARCHIVE_EXT, write_archive
+from utils.log_pipeline import UPLOAD_STARTED, UPLOAD_FINISHED
+
+INDEX_DIR = ".index"       # per-file summaries live next to the logs, in here
+SUMMARY_VERSION = 4
+WORD_RE = re.compile(r"\w{2,}")
+
+# Status lines worth counting, exactly as TrelloAPI logs them. An upload that
+# raised logs "upload failed" instead, so started minus finished is the failures.
+MARKER_RE = re.compile(
+    rb"(Created:)|(Skipped)|(%s:)|(%s:)"
+    % (re.escape(UPLOAD_STARTED.encode()), re.escape(UPLOAD_FINISHED.encode()))
+)
+MARKERS = ("created", "skipped", "uploads_started", "uploads_finished")
+ERROR_LEVEL = 4          # LEVELS index of ERROR
+BURST_GAP = 30           # seconds between errors that still count as one burst
+BURST_MIN = 5            # errors needed before a cluster is called a burst
+_DAY_RE = re.compile(r"(\d{4})-?(\d\d)-?(\d\d)")
+
+
+def log_day(path):
+    """The date a daily log covers — from its file name, else from its mtime."""
+    m = _DAY_RE.search(os.path.basename(path))
+    if m:
+        try:
+            return date(*map(int, m.groups()))
+        except ValueError:
+            pass
+    return datetime.fromtimestamp(os.path.getmtime(path)).date()
+
+
+def day_files(log_dir, ext, first, last):
+    """[(day, path)] for the logs in log_dir dated first..last (inclusive), oldest first.
+
+    Archived days are included; if a day exists both ways (mid-archive), the plain file wins.
+    """
+    try:
+        names = os.listdir(log_dir)
+    except OSError:
+        return []
+    found = {}
+    for name in sorted(names, key=lambda n: n.endswith(ARCHIVE_EXT), reverse=True):
+        plain_name = name[:-len(ARCHIVE_EXT)] if name.endswith(ARCHIVE_EXT) else name
+        path = os.path.join(log_dir, name)
+        if not plain_name.endswith(ext) or not os.path.isfile(path):
+            continue
+        day = log_day(path)
+        if first <= day <= last:
+            found[plain_name] = (day, path)
+    return sorted(found.values())
+
+
+def open_log(path):
+    """(buffer, release) for a daily log, plain (memory-mapped) or archived (block reader)."""
+    if path.endswith(ARCHIVE_EXT):
+        archive = BlockArchive(path)
+        return archive, archive.close
+    log = MappedLog(path)
+    log.open()
+    return log.buf, log.close
+
+
+def line_at(buf, start) -> str:
+    """The log line beginning at byte offset start, decoded."""
+    end = buf.find(b"\n", start)
+    return bytes(buf[start:end if end >= 0 else len(buf)]).decode("utf-8", "replace").rstrip("\r\n")
+
+
+def _seconds(key):
+    return key // 10000 % 100 * 3600 + key // 100 % 100 * 60 + key % 100
+
+
+def error_bursts(index: LogIndex):
+    """[[first time key, last time key, count]] for clusters of ERROR+ entries."""
+    bursts = []
+    first = last = 0
+    count = 0
+    times, levels, msg_at = index.times, index.levels, index.msg_at
+    for i in range(len(index)):
+        t = times[i]
+        if levels[i] < ERROR_LEVEL or not msg_at[i] or not t:
+            continue
+        if count and _seconds(t) - _seconds(last) <= BURST_GAP and t // 1000000 == last // 1000000:
+            count += 1
+        else:
+            if count >= BURST_MIN:
+                bursts.append([first, last, count])
+            first, count = t, 1
+        last = t
+    if count >= BURST_MIN:
+        bursts.append([first, last, count])
+    return bursts
+
+
+def summarize(index: LogIndex, stat) -> dict:
+    """Small, JSON-friendly digest of one indexed log.
+
+    Levels, time span and distinct words (for search pruning) plus the day's
+    analytics: entries per level per hour, upload/status counts and error bursts.
+    """
+    buf, end = index.buf, index.end
+    words = set()
+    marks = [0] * len(MARKERS)
+    pos = 0
+    while pos < end:
+        # Chunks end on a newline so no word (or UTF-8 sequence) is ever cut in two
+        stop = buf.find(b"\n", min(pos + SCAN_CHUNK, end - 1), end) + 1 or end
+        chunk = bytes(buf[pos:stop])
+        for m in MARKER_RE.finditer(chunk):
+            marks[m.lastindex - 1] += 1
+        # Same tokenizer as the query side, so "café" or "Grüße" prune like ASCII words do
+        words.update(WORD_RE.findall(chunk.decode("utf-8", "replace").lower()))
+        pos = stop
+
+    # Only lines that open an entry (own stamp or level) count — not traceback continuations
+    hourly = [[0] * len(LEVELS) for _ in range(24)]
+    for t, level, at in zip(index.times, index.levels, index.msg_at):
+        if t and at:
+            hourly[t // 10000 % 100][level] += 1
+    times = index.times
+    if index.monotonic:
+        stamped = [t for t in times[:1] + times[-1:] if t]
+    else:
+        stamped = [t for t in times if t]
+    return {
+        "version": SUMMARY_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "lines": len(index),
+        "levels": [index.levels.count(code) for code in range(len(LEVELS))],
+        "first_time": min(stamped, default=0),
+        "last_time": max(stamped, default=0),
+        "words": sorted(words),
+        "stats": {
+            "hourly": hourly,
+            **dict(zip(MARKERS, marks)),
+            "bursts": error_bursts(index),
+        },
+    }
+
+
+class LogCatalog:
+    """Cached summaries of every daily log in one folder 🌱
+
+    A summary is rebuilt only when its log's mtime or size moves, so months of old
+    days cost one JSON read each. Summaries let a search skip whole files that
+    can't possibly match before anything gets mapped.
+    """
+
+    def __init__(self, log_dir):
+        self.log_dir = log_dir
+        self.index_dir = os.path.join(log_dir, INDEX_DIR)
+
+    def _summary_path(self, path):
+        return os.path.join(self.index_dir, os.path.basename(path) + ".json")
+
+    def cached_summary(self, path, stat):
+        try:
+            with open(self._summary_path(path), encoding="utf-8") as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (summary.get("version"), summary.get("mtime_ns"), summary.get("size")) != (
+            SUMMARY_VERSION, stat.st_mtime_ns, stat.st_size
+        ):
+            return None
+        return summary
+
+    def save_summary(self, path, summary):
+        os.makedirs(self.index_dir, exist_ok=True)
+        target = self._summary_path(path)
+        tmp = target + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(summary, f, separators=(",", ":"))
+        os.replace(tmp, target)
+
+    @staticmethod
+    def may_match(summary, query, words):
+        """False only when the summary proves the file has no hit for query."""
+        if not summary["lines"]:
+            return False
+        if query.min_level and not any(summary["levels"][query.min_level:]):
+            return False
+        if query.since and summary["last_time"] and summary["last_time"] < query.since:
+            return False
+        if query.until and summary["first_time"] and summary["first_time"] > query.until:
+            return False
+        if words and not query.regex:
+            vocab = summary["words"]
+            # Query words may be partial ("uplo"), so each must sit inside some logged word
+            return all(any(w in v for v in vocab) for w in words)
+        return True
+
+    def summary(self, path):
+        """The summary for one log — from the cache when it is current, else built now."""
+        stat = os.stat(path)
+        summary = self.cached_summary(path, stat)
+        if summary is not None:
+            return summary
+        buf, release = open_log(path)
+        index = LogIndex()
+        try:
+            index.reset(buf, buf.rfind(b"\n") + 1)
+            return self._build_summary(path, index, stat)
+        finally:
+            index.reset(b"")
+            release()
+
+    def _build_summary(self, path, index, stat):
+        summary = summarize(index, stat)
+        try:
+            self.save_summary(path, summary)
+        except OSError:
+            pass  # read-only log folder: still works, just uncached
+        return summary
+
+    def search_file(self, path, query):
+        """Byte offsets where the matching lines of one log start, refreshing its summary on the way.
+
+        Offsets keep a wide search at 8 bytes a hit; line_at() decodes the few on screen.
+        Runs on a worker thread — pure Python, no Qt. Raises re.error for bad regexes.
+        """
+        words = WORD_RE.findall(query.text.lower())
+        stat = os.stat(path)
+        summary = self.cached_summary(path, stat)
+        if summary is not None and not self.may_match(summary, query, words):
+            return array("Q")
+
+        buf, release = open_log(path)
+        index = LogIndex()
+        try:
+            index.reset(buf, buf.rfind(b"\n") + 1)
+            if summary is None:
+                self._build_summary(path, index, stat)
+            starts = index.starts
+            return array("Q", [starts[i] for i in index.search(query)])
+        finally:
+            index.reset(b"")
+            release()
+
+
+class ArchivePolicy:
+    """Compresses daily logs once they are old enough and keeps the folder under a size cap 🌱
+
+    Today's log and the last keep_plain_days stay plain text for the tail and for
+    grep; anything older becomes a block archive. When the folder still outgrows
+    max_bytes, the oldest archives go first — plain days are never deleted.
+    """
+
+    def __init__(self, log_dir, ext=".log", keep_plain_days=3, max_bytes=512 * 1024 * 1024):
+        self.log_dir = log_dir
+        self.ext = ext
+        self.keep_plain_days = keep_plain_days
+        self.max_bytes = max_bytes
+
+    def apply(self, today=None):
+        """Run one pass; returns (archived, deleted) path lists. Safe to call from a worker thread."""
+        today = today or date.today()
+        cutoff = today - timedelta(days=self.keep_plain_days)
+        archived, deleted = [], []
+        for name in sorted(os.listdir(self.log_dir)):
+            path = os.path.join(self.log_dir, name)
+            if not name.endswith(self.ext) or not os.path.isfile(path):
+                continue
+            if log_day(path) >= cutoff:
+                continue
+            try:
+                write_archive(path, path + ARCHIVE_EXT)
+                os.remove(path)
+                archived.append(path)
+            except OSError:
+                continue  # still open elsewhere (Windows) — next pass gets it
+            self._drop_summary(path)  # the archive gets its own on first read
+
+        archives = []
+        total = 0
+        for name in os.listdir(self.log_dir):
+            path = os.path.join(self.log_dir, name)
+            if not os.path.isfile(path) or not (name.endswith(self.ext) or name.endswith(self.ext + ARCHIVE_EXT)):
+                continue
+            size = os.path.getsize(path)
+            total += size
+            if name.endswith(ARCHIVE_EXT):
+                archives.append((log_day(path), path, size))
+        for _, path, size in sorted(archives):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            deleted.append(path)
+            self._drop_summary(path)
+        return archived, deleted
+
+    def _drop_summary(self, path):
+        try:
+            os.remove(os.path.join(self.log_dir, INDEX_DIR, os.path.basename(path) + ".json"))
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    # Round trip: upload lines written the way TrelloAPI writes them must land in the digest
+    import shutil
+    import logging
+    import tempfile
+    from utils.log_pipeline import StructuredLog, phase_timer
+
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, "2026-01-01.log")
+        logger = logging.getLogger("cushions.catalog_check")
+        logger.setLevel(logging.INFO)
+        StructuredLog.install(logger, lambda: path)
+        for name, created in (("notes.md", 2), ("café.md", 0)):
+            logger.info(f"{UPLOAD_STARTED}: {name} (3 paragraphs)")
+            with phase_timer(logger, "upload") as outcome:
+                for i in range(created):
+                    with phase_timer(logger, "create_card", card_id=i, msg=f"Created: Card {i}"):
+                        pass
+                logger.info("Skipped (already exists): Card 9", extra={"phase": "skip_card", "card_id": 3})
+                outcome["msg"] = f"{UPLOAD_FINISHED}: {name}: {created} of 3 cards created"
+        logger.info(f"{UPLOAD_STARTED}: broken.md (1 paragraphs)")
+        try:
+            with phase_timer(logger, "upload"):
+                raise ConnectionError("offline")
+        except ConnectionError:
+            pass
+        StructuredLog.shutdown()
+
+        stats = LogCatalog(folder).summary(path)["stats"]
+        got = {m: stats[m] for m in MARKERS}
+        assert got == {"created": 2, "skipped": 2, "uploads_started": 3, "uploads_finished": 2}, got
+        print(f"upload markers round-trip through summarize: {got}")
+    finally:
+        shutil.rmtree(folder)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - log_index.py parsed, searchable view of a daily log
+-The last of the log indexes read every line once and never needed to read it again, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/log_index.py
+import os
+import re
+import mmap
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+LEVELS = ("", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LEVEL_CODES = {
+    b"DEBUG": 1, b"INFO": 2, b"WARNING": 3, b"WARN": 3,
+    b"ERROR": 4, b"CRITICAL": 5, b"FATAL": 5,
+}
+
+# "2026-02-14 10:22:33,123 - INFO - cushions - message" and the usual bracketed cousins,
+# or a structured line from utils.log_pipeline ({"time": …, "level": …, "logger": …, …}).
+# Every plain group is optional, so tracebacks and other loose lines still match (and inherit).
+LINE_RE = re.compile(
+    rb'^(?:\{"time": ?"(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)[^"]*", ?'
+    rb'"level": ?"(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)", ?"logger": ?"([^"]*)", ?'
+    rb"|(?:\[?(\d{4}-\d\d-\d\d[ T]\d\d:\d\d:\d\d)[^\s\]]*\]?[ \t\-|:]*)?"
+    rb"(?:\[?(DEBUG|INFO|WARNING|WARN|ERROR|CRITICAL|FATAL)\]?[ \t\-|:]*)?"
+    rb"(?:([\w.]+)[ \t]+[-|:][ \t]+)?)",
+    re.M,
+)
+
+SCAN_CHUNK = 4 * 1024 * 1024   # bytes lowered at a time during substring scans
+
+
+def iter_chunks(buf, lo, hi):
+    """(offset, piece) pairs covering buf[lo:hi]; regexes then run on each piece.
+
+    Plain buffers come back whole as one piece; a compressed archive hands over
+    its decompressed blocks, which always end on a line boundary.
+    """
+    chunks = getattr(buf, "iter_chunks", None)
+    return chunks(lo, hi) if chunks is not None else ((0, buf),)
+
+
+def time_key(dt) -> int:
+    """datetime -> the sortable integer the index stores (YYYYMMDDhhmmss)."""
+    return int(dt.strftime("%Y%m%d%H%M%S"))
+
+
+class LogQuery(NamedTuple):
+    text: str = ""
+    regex: bool = False
+    min_level: int = 0     # index into LEVELS; 0 keeps everything
+    since: int = 0         # time_key bounds; 0 leaves that side open
+    until: int = 0
+
+    def refines(self, older: "LogQuery") -> bool:
+        """True when every match of self must already be a match of older."""
+        return (
+            not self.regex and not older.regex
+            and self[2:] == older[2:]
+            and older.text.lower() in self.text.lower()
+        )
+
+
+class LogIndex:
+    """Line offsets plus parsed fields (time, level, logger, message) for one log buffer 🌱
+
+    Fields are parsed once as lines arrive; queries never re-parse. The buffer can be
+    bytes, an mmap or a BlockArchive — the index only ever slices it or walks iter_chunks().
+    """
+
+    def __init__(self):
+        self.reset(b"")
+
+    def reset(self, buf, end=None):
+        self.buf = buf
+        self.end = 0
+        self.starts = array("Q")
+        self.times = array("Q")
+        self.levels = bytearray()
+        self.msg_at = array("H")       # message offset inside its line
+        self.logger_ids = array("H")
+        self.loggers = [""]
+        self._logger_lookup = {b"": 0}
+        self.monotonic = True
+        self._last = None              # (query, result, indexed line count)
+        self.extend(buf, len(buf) if end is None else end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def extend(self, buf, end):
+        """Index the complete lines in buf[self.end:end]; the older prefix must be unchanged."""
+        self.buf = buf
+        if end <= self.end:
+            return
+        times, levels, starts = self.times, self.levels, self.starts
+        last_time = times[-1] if times else 0
+        last_level = levels[-1] if levels else 0
+        for base, piece in iter_chunks(buf, self.end, end):
+            stop = min(end - base, len(piece))
+            for m in LINE_RE.finditer(piece, max(0, self.end - base), stop):
+                start = m.start()
+                if start >= stop:
+                    break
+                ts, level, logger = m.group(1, 2, 3) if m.start(1) >= 0 else m.group(4, 5, 6)
+                if ts:
+                    t = int(ts.translate(None, b"-: T"))
+                    if t < last_time:
+                        self.monotonic = False
+                    last_time = t
+                if level:
+                    last_level = _LEVEL_CODES[level]
+                starts.append(base + start)
+                times.append(last_time)
+                levels.append(last_level)
+                self.msg_at.append(min(m.end() - start, 0xFFFF))
+                self.logger_ids.append(self._logger_id(logger or b""))
+        self.end = end
+
+    def _logger_id(self, name):
+        i = self._logger_lookup.get(name)
+        if i is None:
+            i = self._logger_lookup[name] = len(self.loggers)
+            self.loggers.append(name.decode("utf-8", "replace"))
+        return i
+
+    def _line_end(self, i):
+        return self.starts[i + 1] if i + 1 < len(self.starts) else self.end
+
+    def line(self, i) -> str:
+        return bytes(self.buf[self.starts[i]:self._line_end(i)]).decode("utf-8", "replace").rstrip("\r\n")
+
+    def fields(self, i):
+        """(time key, level name, logger, message) for line i."""
+        line = self.line(i)
+        return self.times[i], LEVELS[self.levels[i]], self.loggers[self.logger_ids[i]], line[self.msg_at[i]:]
+
+    def search(self, query: LogQuery, start_line=0):
+        """Line numbers (>= start_line) matching query, ascending. Raises re.error for bad regexes."""
+        n = len(self.starts)
+        lo, hi = start_line, n
+        if self.monotonic:
+            if query.since:
+                lo = max(lo, bisect_left(self.times, query.since))
+            if query.until:
+                hi = bisect_right(self.times, query.until, lo)
+
+        last = self._last
+        if start_line == 0 and query.text and last is not None and query.refines(last[0]):
+            # Query grew: only earlier hits (plus lines that arrived since) can still match
+            needle = query.text.lower().encode("utf-8")
+            hits = array("I", (i for i in last[1] if lo <= i < hi and self._line_has(i, needle)))
+            if last[2] < n:
+                hits.extend(self._scan(needle, max(lo, last[2]), hi))
+        elif not query.text:
+            hits = array("I", range(lo, hi))
+        elif query.regex:
+            hits = self._scan_regex(re.compile(query.text.encode("utf-8"), re.I | re.M), lo, hi)
+        else:
+            hits = self._scan(query.text.lower().encode("utf-8"), lo, hi)
+
+        if query.min_level:
+            levels = self.levels
+            hits = array("I", (i for i in hits if levels[i] >= query.min_level))
+        if not self.monotonic and (query.since or query.until):
+            times, since, until = self.times, query.since, query.until or float("inf")
+            hits = array("I", (i for i in hits if since <= times[i] <= until))
+
+        if start_line == 0 and query.text:
+            self._last = (query, hits, n)
+        return hits
+
+    def _line_has(self, i, needle):
+        return needle in bytes(self.buf[self.starts[i]:self._line_end(i)]).lower()
+
+    def _scan(self, needle, lo, hi):
+        """Case-insensitive substring scan, lowering one bounded chunk at a time."""
+        out = array("I")
+        if lo >= hi or not needle:
+            return out
+        starts, buf = self.starts, self.buf
+        pos, stop_all = starts[lo], self._line_end(hi - 1)
+        overlap = len(needle) - 1
+        last_line = -1
+        while pos < stop_all:
+            stop = min(pos + SCAN_CHUNK, stop_all)
+            window = bytes(buf[pos:min(stop + overlap, stop_all)]).lower()
+            i = window.find(needle)
+            while 0 <= i and pos + i < stop:
+                line = bisect_right(starts, pos + i, lo, hi) - 1
+                if line != last_line:
+                    out.append(line)
+                    last_line = line
+                i = window.find(needle, self._line_end(line) - pos)
+            pos = stop
+        return out
+
+    def _scan_regex(self, pattern, lo, hi):
+        out = array("I")
+        if lo >= hi:
+            return out
+        starts = self.starts
+        first, stop = starts[lo], self._line_end(hi - 1)
+        last_line = -1
+        for base, piece in iter_chunks(self.buf, first, stop):
+            for m in pattern.finditer(piece, max(0, first - base), min(stop - base, len(piece))):
+                line = bisect_right(starts, base + m.start(), lo, hi) - 1
+                if line != last_line:
+                    out.append(line)
+                    last_line = line
+        return out
+
+
+class MappedLog:
+    """Read-only memory map over a log file that may keep growing 🌱
+
+    The OS pages bytes in on demand, so a 200 MB log costs address space, not RAM.
+    Writers only ever append or rotate; refresh() is what notices when they don't.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.buf = b""
+        self.file_id = None      # (st_dev, st_ino) — changes when the log is rotated
+        self._mm = None
+
+    @property
+    def size(self):
+        return len(self.buf)
+
+    def open(self):
+        """(Re)map the whole file. Returns False when it doesn't exist."""
+        self.close()
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                self.file_id = (st.st_dev, st.st_ino)
+                if st.st_size:
+                    self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self.buf = self._mm
+        except FileNotFoundError:
+            return False
+        return True
+
+    def refresh(self):
+        """'same', 'grown' (prefix unchanged, remapped) or 'reset' (rotated, truncated or gone)."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return "reset"
+        if (st.st_dev, st.st_ino) != self.file_id or st.st_size < self.size:
+            return "reset"
+        if st.st_size == self.size:
+            return "same"
+        file_id = self.file_id
+        self.open()
+        return "grown" if self.file_id == file_id else "reset"
+
+    def close(self):
+        self.buf = b""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
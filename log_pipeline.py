@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - log_pipeline.py structured, off-thread log writing
+-The last of the log writers took every note through the hatch and wrote it up neatly in the back room, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/log_pipeline.py
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Field order is fixed: time, level and logger lead every line so LogIndex can
+# parse them with the same single regex pass it uses for plain-text logs.
+FIELDS = ("time", "level", "logger", "thread", "phase", "card_id", "latency_ms", "msg")
+EXTRA_FIELDS = ("phase", "card_id", "latency_ms")   # passed through logger.*(..., extra={...})
+# Upload milestones, worded once: the uploader logs "<milestone>: <file>…" and LogCatalog counts them
+UPLOAD_STARTED = "Upload started"
+UPLOAD_FINISHED = "Upload finished"
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One compact JSON object per record, keys in FIELDS order 🌱"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+        }
+        for key in EXTRA_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        msg = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            msg = f"{msg}\n{record.exc_text}"
+        entry["msg"] = msg
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DailyJsonHandler(logging.Handler):
+    """Appends JSON lines to whatever path_for_today() says, reopening when the day turns."""
+
+    def __init__(self, path_for_today):
+        super().__init__()
+        self.path_for_today = path_for_today
+        self.setFormatter(JsonLineFormatter())
+        self._path = None
+        self._stream = None
+
+    def emit(self, record):
+        try:
+            path = self.path_for_today()
+            if path != self._path:
+                self._close_stream()
+                self._stream = open(path, "a", encoding="utf-8")
+                self._path = path
+            self._stream.write(self.format(record) + "\n")
+            self._stream.flush()   # whole lines only, so the viewer's tail never sees half a record
+        except Exception:
+            self.handleError(record)
+
+    def _close_stream(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def close(self):
+        self.acquire()
+        try:
+            self._close_stream()
+        finally:
+            self.release()
+        super().close()
+
+
+class StructuredLog:
+    """Routes a logger through a queue to a background JSON writer 🌱
+
+    Callers only pay for a queue put; formatting and disk I/O happen on the
+    listener's thread. Install once at startup (AppLogger's setup is the natural
+    place) and shut down on exit so the queue drains:
+
+        StructuredLog.install(logging.getLogger("cushions"), AppLogger.get().get_today_log_path)
+    """
+    _listener = None
+    _logger = None
+    _replaced = []
+
+    @classmethod
+    def install(cls, logger: logging.Logger, path_for_today) -> None:
+        if cls._listener is not None:
+            return
+        q = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(q, DailyJsonHandler(path_for_today), respect_handler_level=True)
+        # File handlers would still write inline; the queue takes over their job
+        cls._replaced = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+        for handler in cls._replaced:
+            logger.removeHandler(handler)
+            handler.close()
+        logger.addHandler(logging.handlers.QueueHandler(q))
+        listener.start()
+        cls._listener, cls._logger = listener, logger
+        atexit.register(cls.shutdown)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flush what's queued and stop the writer thread."""
+        if cls._listener is None:
+            return
+        for handler in [h for h in cls._logger.handlers if isinstance(h, logging.handlers.QueueHandler)]:
+            cls._logger.removeHandler(handler)
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.close()
+        cls._listener = cls._logger = None
+
+
+@contextmanager
+def phase_timer(logger, phase, card_id=None, level=logging.INFO, msg=None):
+    """Log one structured line when the block finishes, with how long it took.
+
+        with phase_timer(log, "create_card", card_id=n) as outcome:
+            if not api.create_card(...):
+                outcome.update(level=logging.WARNING, msg="create failed")
+
+    The yielded dict lets the block adjust level and msg once it knows how things
+    went. If the block raises, the line is logged at ERROR and the exception re-raised.
+    """
+    outcome = {"level": level, "msg": msg or f"{phase} done"}
+    start = time.perf_counter()
+    try:
+        yield outcome
+    except BaseException as e:
+        latency = round((time.perf_counter() - start) * 1000, 1)
+        logger.error(f"{phase} failed: {e!r}", extra={"phase": phase, "card_id": card_id, "latency_ms": latency})
+        raise
+    latency = round((time.perf_counter() - start) * 1000, 1)
+    logger.log(outcome["level"], outcome["msg"], extra={"phase": phase, "card_id": card_id, "latency_ms": latency})
+
+
+def render_line(line: str) -> str:
+    """Human-readable form of one log line; plain-text lines pass through unchanged."""
+    if not line.startswith("{"):
+        return line
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return line
+    if not isinstance(entry, dict):
+        return line
+    stamp = str(entry.get("time", "")).replace("T", " ")
+    tags = []
+    if entry.get("phase"):
+        tags.append(str(entry["phase"]))
+    if entry.get("card_id") is not None:
+        tags.append(f"card {entry['card_id']}")
+    if entry.get("latency_ms") is not None:
+        tags.append(f"{entry['latency_ms']} ms")
+    if entry.get("thread") and entry["thread"] != "MainThread":
+        tags.append(str(entry["thread"]))
+    tag = f"[{' · '.join(tags)}] " if tags else ""
+    msg = str(entry.get("msg", "")).replace("\n", " ⏎ ")
+    return f"{stamp} - {entry.get('level', '')} - {entry.get('logger', '')} - {tag}{msg}"
@@ -8,6 +8,12 @@
 
 # widgets/log_viewer_dialog.py
 import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import partial
 
 from PySide6.QtWidgets import (
     QDialog,
@@ -15,18 +21,128 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QTextBrowser,
+    QTextEdit,
     QSlider,
     QLineEdit,
     QPushButton,
     QLabel,
+    QCheckBox,
+    QComboBox,
+    QTimeEdit,
+    QDateEdit,
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QObject, QTimer, QTime, QDate, QEvent, QFileSystemWatcher, Signal
 from PySide6.QtGui import QFont
 
 from utils.logging import AppLogger
+from utils.log_index import LogIndex, LogQuery, MappedLog, LEVELS
+from utils.log_catalog import LogCatalog, ArchivePolicy, day_files, open_log, line_at, BURST_GAP, BURST_MIN
+from utils.log_pipeline import render_line
+
+
+WHEEL_ROWS = 3    # lines moved per wheel notch
+UNMAP_AFTER_MS = 30_000   # hidden this long, today's map is released (Windows won't rename/delete a mapped file)
+SEARCH_THREADS = 4
+FOUND_OPEN_MAX = 4   # past days kept open while paging cross-day hits
+
+
+class CrossDaySearch(QObject):
+    """Searches a run of daily logs on a thread pool, one file per task 🌱
+
+    Each finished day arrives through found() as soon as it is ready. Starting a new
+    search retires the old one; its stragglers are recognised by generation and dropped.
+    The same fan-out serves summaries: summarize() delivers each day's cached digest.
+    """
+    found = Signal(object, object)        # day, hit line offsets or summary dict — only for the current run
+    finished = Signal(int)                # number of days searched
+    _day_done = Signal(int, object, object, object)   # generation, day, lines, error
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = None
+        self.generation = 0
+        self.pending = []
+        self.total = self.remaining = 0
+        self._day_done.connect(self._on_day_done)
+
+    def start(self, log_dir, files, query_for_day):
+        """files: [(day, path)]; query_for_day(day) -> LogQuery for that day."""
+        catalog = LogCatalog(log_dir)
+        self._run(files, lambda day, path: (catalog.search_file, path, query_for_day(day)))
+
+    def summarize(self, log_dir, files):
+        catalog = LogCatalog(log_dir)
+        self._run(files, lambda day, path: (catalog.summary, path))
+
+    def _run(self, files, task_for):
+        self.cancel()
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=SEARCH_THREADS)
+        self.total = self.remaining = len(files)
+        for day, path in reversed(files):   # newest first — usually what you're after
+            future = self.pool.submit(*task_for(day, path))
+            future.add_done_callback(partial(self._on_future_done, self.generation, day))
+            self.pending.append(future)
+        if not files:
+            self.finished.emit(0)
+
+    def housekeep(self, log_dir, ext):
+        """Archive old days and enforce the size cap in the background."""
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=SEARCH_THREADS)
+        self.pool.submit(self._housekeep, log_dir, ext)
+
+    @staticmethod
+    def _housekeep(log_dir, ext):
+        logger = AppLogger.get()
+        try:
+            archived, deleted = ArchivePolicy(log_dir, ext).apply()
+        except OSError as e:
+            logger.warning(f"Log archiving skipped: {e}")
+            return
+        if archived or deleted:
+            logger.info(f"Log archive: compressed {len(archived)} day(s), removed {len(deleted)} over the size cap")
+
+    def cancel(self):
+        self.generation += 1
+        for future in self.pending:
+            future.cancel()
+        self.pending = []
+
+    def shutdown(self):
+        self.cancel()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    def _on_future_done(self, generation, day, future):
+        # Runs on a pool thread — only emit, let Qt queue it over
+        if future.cancelled():
+            return
+        error = future.exception()
+        self._day_done.emit(generation, day, None if error else future.result(), error)
+
+    def _on_day_done(self, generation, day, result, error):
+        if generation != self.generation:
+            return
+        if error is not None:
+            AppLogger.get().warning(f"Log search skipped {day}: {error}")
+        elif result:
+            self.found.emit(day, result)
+        self.remaining -= 1
+        if not self.remaining:
+            self.pending = []
+            self.finished.emit(self.total)
 
 
 class LogViewerDialog(QDialog):
+    """Today's log, memory-mapped and drawn one screenful at a time 🌱
+
+    The file is never copied into Python or into the text widget: the index keeps
+    line offsets, and only the rows under the viewport are decoded and shown.
+    The slider position *is* the top row.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = AppLogger.get()
@@ -71,10 +187,60 @@ class LogViewerDialog(QDialog):
         self.search_input.textChanged.connect(self.debounce_filter)
         left_layout.addWidget(self.search_input)
 
-        # Log content area
+        # Filter refinements: regex, minimum level and a time-of-day window
+        filter_row = QHBoxLayout()
+        filter_row.setSpacing(8)
+        self.regex_check = QCheckBox("Regex")
+        self.regex_check.toggled.connect(self.debounce_filter)
+        filter_row.addWidget(self.regex_check)
+
+        self.level_combo = QComboBox()
+        self.level_combo.addItem("All levels", 0)
+        for code, name in enumerate(LEVELS[1:], start=1):
+            self.level_combo.addItem(f"{name}+", code)
+        self.level_combo.currentIndexChanged.connect(self.debounce_filter)
+        filter_row.addWidget(self.level_combo)
+
+        filter_row.addStretch()
+        self.time_check = QCheckBox("Between")
+        self.time_check.toggled.connect(self.debounce_filter)
+        filter_row.addWidget(self.time_check)
+        self.time_from = QTimeEdit(QTime(0, 0))
+        self.time_to = QTimeEdit(QTime(23, 59))
+        for edit in (self.time_from, self.time_to):
+            edit.setDisplayFormat("HH:mm")
+            edit.timeChanged.connect(self.debounce_filter)
+            filter_row.addWidget(edit)
+        left_layout.addLayout(filter_row)
+
+        # Day range — off means today's file only; on searches every daily log in range
+        days_row = QHBoxLayout()
+        days_row.setSpacing(8)
+        self.days_check = QCheckBox("Search days")
+        self.days_check.toggled.connect(self.debounce_filter)
+        days_row.addWidget(self.days_check)
+        today = QDate.currentDate()
+        self.day_from = QDateEdit(today.addDays(-7))
+        self.day_to = QDateEdit(today)
+        for edit in (self.day_from, self.day_to):
+            edit.setDisplayFormat("yyyy-MM-dd")
+            edit.setCalendarPopup(True)
+            edit.setMaximumDate(today)
+            edit.dateChanged.connect(self.debounce_filter)
+            days_row.addWidget(edit)
+        days_row.addStretch()
+        for w in (self.regex_check, self.time_check, self.days_check):
+            w.setStyleSheet("color: #a08a7a; font-size: 12px;")
+        left_layout.addLayout(days_row)
+
+        # Log content area — holds just the visible window, so no wrapping and no native scrolling
         self.log_display = QTextBrowser()
         self.log_display.setReadOnly(True)
         self.log_display.setFont(QFont("Consolas", 11))
+        self.log_display.setLineWrapMode(QTextEdit.NoWrap)
+        self.log_display.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.log_display.installEventFilter(self)
+        self.log_display.viewport().installEventFilter(self)
         self.log_display.setStyleSheet("""
             QTextBrowser {
                 background: #222;
@@ -87,6 +253,11 @@ class LogViewerDialog(QDialog):
         """)
         left_layout.addWidget(self.log_display, stretch=1)
 
+        self.stats_view = QTextBrowser()
+        self.stats_view.setStyleSheet("QTextBrowser { background: #222; color: #e0e0e0; border: none; }")
+        self.stats_view.setVisible(False)
+        left_layout.addWidget(self.stats_view, stretch=1)
+
         # Refresh button
         refresh_btn = QPushButton("↻ Refresh")
         refresh_btn.setFixedHeight(32)
@@ -102,7 +273,29 @@ class LogViewerDialog(QDialog):
             }
         """)
         refresh_btn.clicked.connect(self.load_log_content)
-        left_layout.addWidget(refresh_btn)
+
+        # Live tail toggle — new lines stream in as the logger writes them
+        self.follow_check = QCheckBox("Follow live")
+        self.follow_check.setChecked(True)
+        self.follow_check.setStyleSheet("color: #a08a7a; font-size: 12px;")
+        self.follow_check.toggled.connect(self._on_follow_toggled)
+
+        # Summary toggle — swaps the lines for per-day analytics over the same days
+        self.summary_btn = QPushButton("📊 Summary")
+        self.summary_btn.setCheckable(True)
+        self.summary_btn.setFixedHeight(32)
+        self.summary_btn.setStyleSheet(refresh_btn.styleSheet() + """
+            QPushButton:checked {
+                background-color: #4a3a2f;
+            }
+        """)
+        self.summary_btn.toggled.connect(self._on_summary_toggled)
+
+        bottom_row = QHBoxLayout()
+        bottom_row.addWidget(refresh_btn, stretch=1)
+        bottom_row.addWidget(self.summary_btn)
+        bottom_row.addWidget(self.follow_check)
+        left_layout.addLayout(bottom_row)
 
         main_layout.addWidget(left_container, stretch=1)
 
@@ -113,10 +306,12 @@ class LogViewerDialog(QDialog):
         slider_layout.setContentsMargins(0, 10, 0, 10)
         slider_layout.setSpacing(0)
 
+        # One step per row; inverted so value 0 (the first row) sits at the top
         self.slider = QSlider(Qt.Vertical)
-        self.slider.setRange(0, 100)
+        self.slider.setRange(0, 0)
         self.slider.setValue(0)
         self.slider.setInvertedAppearance(True)
+        self.slider.setInvertedControls(True)
         self.slider.setStyleSheet("""
             QSlider::groove:vertical {
                 background: #3a3a3a;
@@ -136,104 +331,549 @@ class LogViewerDialog(QDialog):
                 background: #8a7a67;
             }
         """)
-        self.slider.valueChanged.connect(self.on_slider_changed)
+        self.slider.valueChanged.connect(self._scroll_to)
         slider_layout.addWidget(self.slider, stretch=1)
 
         main_layout.addWidget(slider_container)
 
-        # State
-        self.full_content = ""
-        self.lines = []
+        # State — a read-only map of the file plus an index of its whole lines (index.end)
+        self.log = MappedLog(None)
+        self._log_path = None     # today's file as last opened; None until the first load
+        self.index = LogIndex()
+        self.rows = None          # None shows every line; otherwise the matching line numbers
+        self.found = None         # cross-day mode: day -> hit line offsets, shown instead of rows
+        self.found_days = []      # days with hits, oldest first
+        self.found_ends = []      # running row count at the end of each of found_days
+        self._found_paths = {}    # day -> log path for the current cross-day search
+        self._found_open = {}     # day -> (buffer, release) for days decoded on screen lately
+        self.day_index = None     # a past day (plain or archived) being paged through
+        self._day_release = None
+        self._housekept = False
+        self._refreshed = False   # refresh() already ran for the current show
+        self.top_row = 0
+        self.message = ""         # shown instead of rows when there are none
         self.filter_timer = QTimer(self)
         self.filter_timer.setSingleShot(True)
         self.filter_timer.timeout.connect(self._apply_filter_now)
 
-        # Scroll synchronization
-        self.log_display.verticalScrollBar().valueChanged.connect(self.update_slider_from_text)
-        self.log_display.document().contentsChanged.connect(self.update_slider_range)
+        # Tail follow: the watcher nudges, a short timer coalesces bursts,
+        # and a slow poll covers filesystems where change events get lost
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._schedule_tail)
+        self.watcher.directoryChanged.connect(self._schedule_tail)
+        self.tail_timer = QTimer(self)
+        self.tail_timer.setSingleShot(True)
+        self.tail_timer.timeout.connect(self.read_new_lines)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(2000)
+        self.poll_timer.timeout.connect(self.read_new_lines)
+        # A quick reopen finds today's map still warm; a long absence lets rotation and archiving have the file
+        self.unmap_timer = QTimer(self)
+        self.unmap_timer.setSingleShot(True)
+        self.unmap_timer.setInterval(UNMAP_AFTER_MS)
+        self.unmap_timer.timeout.connect(self._release_hidden_map)
+
+        self.day_search = CrossDaySearch(self)
+        self.day_search.found.connect(self._on_day_found)
+        self.day_search.finished.connect(self._on_day_search_finished)
+        self.day_stats = CrossDaySearch(self)
+        self.day_stats.found.connect(self._on_day_summarized)
+        self.day_stats.finished.connect(lambda _days: self._render_summary(done=True))
+        self.summaries = {}       # day -> summary dict, for the summary panel
+        self._summary_range = (date.today(), date.today())
+        # Many cached days land within a few ms — draw once for the lot
+        self.summary_timer = QTimer(self)
+        self.summary_timer.setSingleShot(True)
+        self.summary_timer.timeout.connect(self._render_summary)
 
-        # Initial load
-        QTimer.singleShot(0, self.load_log_content)
 
     def load_log_content(self):
         log_path = self.logger.get_today_log_path()
         self.path_label.setText(f"Log: {os.path.basename(log_path)}")
+        self._log_path = log_path
+        self._unmap()
+        self.log.path = log_path
+        self._watch(log_path)
 
         if not os.path.exists(log_path):
-            msg = (
+            self.message = (
                 "No entries logged today yet.\n\n"
                 "Nothing has happened yet — or the cushions are still very quiet ☕"
             )
-            self.log_display.setPlainText(msg)
-            self.full_content = ""
-            self.lines = []
+            self.rows = None
             self.update_slider_range()
             return
 
         try:
-            with open(log_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-
-            self.full_content = content
-            self.lines = content.splitlines()
-            self.log_display.setPlainText(content)
-
-            # Auto-scroll to bottom on fresh load
-            self.log_display.verticalScrollBar().setValue(
-                self.log_display.verticalScrollBar().maximum()
-            )
-
+            self.log.open()
+            # Only whole lines are indexed; a half-written last line waits for the tail
+            buf = self.log.buf
+            self.index.reset(buf, buf.rfind(b"\n") + 1)
         except Exception:
             self.logger.exception("Failed to read today's log file")
-            error_text = (
+            self._unmap()
+            self.message = (
                 "Could not read the log file.\n\n"
                 "Check the console/log for details or try refreshing."
             )
-            self.log_display.setPlainText(error_text)
-            self.full_content = ""
-            self.lines = []
+            self.rows = None
+            self.update_slider_range()
+            return
 
-        self.update_slider_range()
         self._apply_filter_now()
 
-    def update_slider_range(self):
-        max_scroll = self.log_display.verticalScrollBar().maximum()
-        self.slider.setRange(0, max_scroll if max_scroll > 0 else 100)
-        # Stay at bottom if we were already there
-        if self.slider.value() in (0, self.slider.maximum()):
-            self.slider.setValue(self.slider.maximum())
+    def _unmap(self):
+        # Drop the index's view first — the map can't close under a live reader
+        self.index.reset(b"")
+        self.log.close()
+        self.log.file_id = None
+
+    def _watch(self, log_path):
+        old = self.watcher.files() + self.watcher.directories()
+        if old:
+            self.watcher.removePaths(old)
+        self.watcher.addPath(os.path.dirname(log_path) or ".")
+        if os.path.exists(log_path):
+            self.watcher.addPath(log_path)
+
+    def _release_hidden_map(self):
+        if not self.isVisible():
+            self._unmap()  # refresh() on the next open maps and indexes afresh
+
+    def _schedule_tail(self, _path=None):
+        if self.isVisible() and self.follow_check.isChecked():
+            self.tail_timer.start(100)
+
+    def refresh(self):
+        """Catch up on reopen: only new bytes are indexed unless the day or the file changed."""
+        self._refreshed = True
+        if self.log.file_id is None or self._log_path != self.logger.get_today_log_path():
+            self.load_log_content()
+        else:
+            self.read_new_lines(force=True)
+            # Hiding cancelled these runs — start them again
+            if self.summary_btn.isChecked():
+                self._refresh_summary()
+            if self.days_check.isChecked():
+                self._apply_filter_now()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.unmap_timer.stop()
+        if not self._refreshed:
+            # Opened without DialogPool (which refreshes before showing): catch up once here
+            QTimer.singleShot(0, self.refresh)
+        if not self._housekept:
+            self._housekept = True
+            log_path = self.logger.get_today_log_path()
+            self.day_search.housekeep(os.path.dirname(log_path) or ".", os.path.splitext(log_path)[1])
+        if self.follow_check.isChecked():
+            self.poll_timer.start()
+
+    def hideEvent(self, event):
+        self.poll_timer.stop()  # no tailing for a closed window
+        self.day_search.cancel()
+        self.day_stats.cancel()
+        self.tail_timer.stop()
+        self._close_day()
+        self._close_found()  # hits stay; their days reopen when drawn again
+        self.unmap_timer.start()  # today's map stays warm for a quick reopen, then is let go
+        self._refreshed = False
+        super().hideEvent(event)
+
+    def _on_follow_toggled(self, on):
+        if on:
+            self.poll_timer.start()
+            self.read_new_lines()
+        else:
+            self.poll_timer.stop()
+            self.tail_timer.stop()
 
-    def on_slider_changed(self, value):
-        self.log_display.verticalScrollBar().setValue(value)
+    def read_new_lines(self, force=False):
+        """Index only the bytes appended since last time; reload on rotation, truncation or a new day."""
+        if not (force or self.follow_check.isChecked()):
+            return
+        log_path = self.logger.get_today_log_path()
+        if log_path != self._log_path or self.log.file_id is None:
+            if os.path.exists(log_path):
+                self.load_log_content()
+            return
+        try:
+            state = self.log.refresh()
+        except OSError:
+            self.logger.exception("Failed to tail today's log file")
+            return
+        if state == "reset":
+            self.load_log_content()
+            return
+        if log_path not in self.watcher.files():
+            self.watcher.addPath(log_path)  # some writers replace the file, which drops the watch
+        if state == "same":
+            return
 
-    def update_slider_from_text(self, value):
+        buf = self.log.buf
+        old_lines = len(self.index)
+        self.index.extend(buf, buf.rfind(b"\n") + 1)
+        if len(self.index) > old_lines:
+            self._append_lines(old_lines)
+
+    def _append_lines(self, first_line):
+        """Take in lines from first_line on, following them if the view sits at the bottom."""
+        if self.found is not None or self.day_index is not None:
+            return  # showing other days; today's lines are picked up on the next search
+        query = self._current_query()
+        if not first_line or self.message:
+            self._apply_filter_now()  # placeholder text on screen — redraw properly
+            return
+        pinned = self.top_row >= self.slider.maximum()  # stay put if the reader scrolled up
+        if self._is_filtering(query):
+            try:
+                hits = self.index.search(query, start_line=first_line)
+            except re.error:
+                return
+            if not hits:
+                return
+            self.rows.extend(hits)
+        self.update_slider_range(follow=pinned)
+        self._render()
+
+    # --- virtual window ------------------------------------------------------
+
+    def _view_index(self):
+        return self.day_index if self.day_index is not None else self.index
+
+    def row_count(self):
+        if self.found is not None:
+            return self.found_ends[-1] if self.found_ends else 0
+        return len(self._view_index()) if self.rows is None else len(self.rows)
+
+    def visible_rows(self):
+        spacing = self.log_display.fontMetrics().lineSpacing()
+        height = self.log_display.viewport().height() - 2 * int(self.log_display.document().documentMargin())
+        return max(1, height // max(1, spacing))
+
+    def update_slider_range(self, follow=False):
+        """Slider spans the possible top rows; follow jumps to the last screenful."""
+        last_top = max(0, self.row_count() - self.visible_rows())
         self.slider.blockSignals(True)
-        self.slider.setValue(value)
+        self.slider.setRange(0, last_top)
+        self.slider.setPageStep(self.visible_rows())
+        self.slider.setValue(last_top if follow else min(self.top_row, last_top))
         self.slider.blockSignals(False)
+        self.top_row = self.slider.value()
+
+    def _scroll_to(self, row):
+        row = max(0, min(row, self.slider.maximum()))
+        if self.slider.value() != row:
+            self.slider.setValue(row)  # comes back through valueChanged
+            return
+        self.top_row = row
+        self._render()
+
+    def _render(self):
+        """Decode and show only the rows under the viewport."""
+        if not self.row_count():
+            self.log_display.setPlainText(self.message)
+            return
+        h_bar = self.log_display.horizontalScrollBar()
+        h_pos = h_bar.value()
+        stop = min(self.top_row + self.visible_rows(), self.row_count())
+        index = self._view_index()
+        line = lambda i: render_line(index.line(i))  # structured lines read like the plain ones
+        if self.found is not None:
+            text = "\n".join(f">> {render_line(self._found_line(r))}" for r in range(self.top_row, stop))
+        elif self.rows is None:
+            text = "\n".join(line(i) for i in range(self.top_row, stop))
+        else:
+            text = "\n".join(f">> {line(self.rows[r])}" for r in range(self.top_row, stop))
+        self.log_display.setPlainText(text)
+        h_bar.setValue(h_pos)
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind == QEvent.Wheel:
+            notches = event.angleDelta().y() / 120
+            if notches:
+                self._scroll_to(self.top_row - round(notches * WHEEL_ROWS))
+                return True
+        elif kind == QEvent.Resize and obj is self.log_display.viewport():
+            pinned = self.top_row >= self.slider.maximum()
+            self.update_slider_range(follow=pinned)
+            self._render()
+        elif kind == QEvent.KeyPress:
+            page = self.visible_rows()
+            moves = {
+                Qt.Key_Up: -1, Qt.Key_Down: 1,
+                Qt.Key_PageUp: -page, Qt.Key_PageDown: page,
+            }
+            key = event.key()
+            if key in moves:
+                self._scroll_to(self.top_row + moves[key])
+                return True
+            if key in (Qt.Key_Home, Qt.Key_End) and event.modifiers() & Qt.ControlModifier:
+                self._scroll_to(0 if key == Qt.Key_Home else self.slider.maximum())
+                return True
+        return super().eventFilter(obj, event)
 
     def debounce_filter(self):
         self.filter_timer.start(200)
 
+    def _current_query(self, day=None):
+        since = until = 0
+        if self.time_check.isChecked():
+            # Time-of-day window on the log's own day (YYYYMMDD from its first stamp)
+            times = self.index.times
+            if day is not None:
+                day = int(day.strftime("%Y%m%d"))
+            elif len(times) and times[0]:
+                day = times[0] // 1000000
+            else:
+                day = int(date.today().strftime("%Y%m%d"))
+            since = day * 1000000 + int(self.time_from.time().toString("HHmm")) * 100
+            until = day * 1000000 + int(self.time_to.time().toString("HHmm")) * 100 + 59
+        return LogQuery(
+            text=self.search_input.text().strip(),
+            regex=self.regex_check.isChecked(),
+            min_level=self.level_combo.currentData() or 0,
+            since=since,
+            until=until,
+        )
+
+    @staticmethod
+    def _is_filtering(query):
+        return bool(query.text or query.min_level or query.since or query.until)
+
     def _apply_filter_now(self):
-        search_text = self.search_input.text().strip().lower()
-        if not search_text:
-            self.log_display.setPlainText(self.full_content)
-            self.log_display.verticalScrollBar().setValue(
-                self.log_display.verticalScrollBar().maximum()
-            )
-            self.update_slider_range()
+        query = self._current_query()
+        self.message = ""
+        self.day_search.cancel()
+        if self.summary_btn.isChecked() and self._summary_days() != self._summary_range:
+            self._refresh_summary()  # the text filter doesn't feed the summary — only the day range does
+        if self.days_check.isChecked():
+            self._start_day_search(query)
+            return
+        self._close_day()
+        self._reset_found(None)
+        if self._log_path:
+            self.path_label.setText(f"Log: {os.path.basename(self._log_path)}")
+        if not self._is_filtering(query):
+            self.rows = None
+            if not len(self.index):
+                self.message = "The log is empty so far ☕"
+            self.update_slider_range(follow=True)
+            self._render()
             return
 
-        filtered_lines = [
-            f">> {line}" for line in self.lines if search_text in line.lower()
-        ]
+        try:
+            hits = self.index.search(query)
+        except re.error as e:
+            hits = array("I")
+            self.message = f"That pattern doesn't parse: {e}"
+        else:
+            if not hits:
+                shown = query.text or "these filters"
+                self.message = f'No matches for "{shown}"\n\nTry a different term…'
 
-        if filtered_lines:
-            self.log_display.setPlainText("\n".join(filtered_lines))
+        self.rows = hits
+        self.top_row = 0
+        self.update_slider_range()
+        self._render()
+
+    # --- cross-day search ----------------------------------------------------
+
+    def _start_day_search(self, query):
+        self._close_day()
+        self._reset_found({})
+        self.top_row = 0
+        first, last = self.day_from.date().toPython(), self.day_to.date().toPython()
+        if first > last:
+            first, last = last, first
+        if not self._is_filtering(query) and first == last:
+            self._open_day(first)
+            return
+        if not self._is_filtering(query):
+            self.message = "Type something (or pick a level) to search across days 🔎"
         else:
-            self.log_display.setPlainText(
-                f'No matches for "{search_text}"\n\nTry a different term…'
-            )
+            if query.regex:
+                try:
+                    re.compile(query.text)
+                except re.error as e:
+                    self.message = f"That pattern doesn't parse: {e}"
+            if not self.message:
+                log_path = self._log_path or self.logger.get_today_log_path()
+                log_dir = os.path.dirname(log_path) or "."
+                files = day_files(log_dir, os.path.splitext(log_path)[1], first, last)
+                self._found_paths = dict(files)
+                self.message = f"Searching {len(files)} day(s)…"
+                self.path_label.setText(f"Logs: {first} → {last}")
+                self.day_search.start(log_dir, files, self._current_query)
+        self.update_slider_range()
+        self._render()
+
+    def _open_day(self, day):
+        """Page through one whole day; archived days decompress only the blocks on screen."""
+        self._reset_found(None)
+        self.rows = None
+        if day == date.today():
+            self.update_slider_range(follow=True)  # today is already open, and tailing
+            self._render()
+            return
+        log_path = self._log_path or self.logger.get_today_log_path()
+        files = day_files(os.path.dirname(log_path) or ".", os.path.splitext(log_path)[1], day, day)
+        if not files:
+            self.message = f"No log for {day} 🍃"
+        else:
+            path = files[0][1]
+            try:
+                buf, self._day_release = open_log(path)
+                self.day_index = LogIndex()
+                self.day_index.reset(buf, buf.rfind(b"\n") + 1)
+            except Exception:
+                self.logger.exception(f"Failed to open log {path}")
+                self._close_day()
+                self.message = "Could not read that day's log.\n\nCheck the console/log for details."
+            else:
+                self.path_label.setText(f"Log: {os.path.basename(path)}")
+                if not len(self.day_index):
+                    self.message = f"The log for {day} is empty ☕"
+        self.update_slider_range()
+        self._render()
+
+    def _close_day(self):
+        if self.day_index is not None:
+            self.day_index.reset(b"")
+            self.day_index = None
+        if self._day_release is not None:
+            self._day_release()
+            self._day_release = None
+
+    def _reset_found(self, found):
+        self._close_found()
+        self.found = found
+        self.found_days, self.found_ends = [], []
+
+    def _close_found(self):
+        for _buf, release in self._found_open.values():
+            release()
+        self._found_open = {}
+
+    def _on_day_found(self, day, offsets):
+        # Slot the day in among the others; only the running counts after it move
+        self.found[day] = offsets
+        k = bisect_left(self.found_days, day)
+        self.found_days.insert(k, day)
+        self.found_ends.insert(k, 0)
+        total = self.found_ends[k - 1] if k else 0
+        for j in range(k, len(self.found_days)):
+            total += len(self.found[self.found_days[j]])
+            self.found_ends[j] = total
+        self.update_slider_range()
+        self._render()
+
+    def _on_day_search_finished(self, days):
+        if self.found is not None and not self.found_ends:
+            self.message = "No matches in those days\n\nTry a wider range or a different term…"
+            self._render()
+
+    def _found_line(self, row):
+        """Decode cross-day row `row`, opening its day's log if it isn't open already."""
+        k = bisect_right(self.found_ends, row)
+        day = self.found_days[k]
+        offset = self.found[day][row - (self.found_ends[k - 1] if k else 0)]
+        opened = self._found_open.get(day)
+        if opened is None:
+            if len(self._found_open) >= FOUND_OPEN_MAX:
+                self._found_open.pop(next(iter(self._found_open)))[1]()  # least recently opened
+            try:
+                opened = self._found_open[day] = open_log(self._found_paths[day])
+            except (OSError, ValueError) as e:
+                return f"[{day}: log no longer readable ({e}) — search again]"
+        return line_at(opened[0], offset)
+
+    # --- summary panel -------------------------------------------------------
+
+    def _on_summary_toggled(self, on):
+        self.log_display.setVisible(not on)
+        self.slider.setVisible(not on)
+        self.stats_view.setVisible(on)
+        if on:
+            self._refresh_summary()
+        else:
+            self.day_stats.cancel()
+
+    def _summary_days(self):
+        if not self.days_check.isChecked():
+            return date.today(), date.today()
+        first, last = self.day_from.date().toPython(), self.day_to.date().toPython()
+        return (first, last) if first <= last else (last, first)
+
+    def _refresh_summary(self):
+        """Fan the chosen days out to the pool; cached days come straight back from disk."""
+        first, last = self._summary_days()
+        log_path = self._log_path or self.logger.get_today_log_path()
+        log_dir = os.path.dirname(log_path) or "."
+        self.summaries = {}
+        self._summary_range = (first, last)
+        self.day_stats.summarize(log_dir, day_files(log_dir, os.path.splitext(log_path)[1], first, last))
+        self._render_summary()
+
+    def _on_day_summarized(self, day, summary):
+        self.summaries[day] = summary
+        self.summary_timer.start(50)
+
+    def _render_summary(self, done=False):
+        first, last = self._summary_range
+        span = f"{first}" if first == last else f"{first} → {last}"
+        if not self.summaries:
+            note = "No logs in that range 🍃" if done else "Summarising…"
+            self.stats_view.setHtml(f"<h3>{span}</h3><p>{note}</p>")
+            return
+
+        hourly = [[0] * len(LEVELS) for _ in range(24)]
+        totals = dict.fromkeys(("created", "skipped", "uploads_started", "uploads_finished"), 0)
+        bursts = []
+        for day in sorted(self.summaries):
+            stats = self.summaries[day].get("stats", {})
+            for hour, counts in enumerate(stats.get("hourly", ())):
+                for level, n in enumerate(counts):
+                    hourly[hour][level] += n
+            for key in totals:
+                totals[key] += stats.get(key, 0)
+            bursts.extend(stats.get("bursts", ()))
+        level_totals = [sum(row[level] for row in hourly) for level in range(len(LEVELS))]
+
+        def stamp(key):
+            s = str(key)
+            return f"{s[:4]}-{s[4:6]}-{s[6:8]} {s[8:10]}:{s[10:12]}:{s[12:14]}"
+
+        cell = 'style="padding: 2px 10px; text-align: right;"'
+        head = "".join(f"<th {cell}>{name}</th>" for name in LEVELS[1:])
+        rows = "".join(
+            f"<tr><td {cell}>{hour:02d}:00</td>" + "".join(f"<td {cell}>{n or ''}</td>" for n in counts[1:]) + "</tr>"
+            for hour, counts in enumerate(hourly) if any(counts[1:])
+        )
+        total_row = "".join(f"<td {cell}><b>{n}</b></td>" for n in level_totals[1:])
+        burst_items = "".join(
+            f"<li>{stamp(a)} → {stamp(b)[11:]} · {n} errors</li>"
+            for a, b, n in sorted(bursts, key=lambda burst: -burst[2])[:10]
+        ) or "<li>None — calm seas ⛵</li>"
+        pending = "" if done or not self.day_stats.remaining else f" <i>({self.day_stats.remaining} day(s) still counting…)</i>"
+
+        self.stats_view.setHtml(f"""
+            <h3>{span} · {len(self.summaries)} day(s){pending}</h3>
+            <p>Uploads started <b>{totals['uploads_started']}</b> · finished <b>{totals['uploads_finished']}</b><br>
+            Cards created <b>{totals['created']}</b> · skipped <b>{totals['skipped']}</b></p>
+            <table cellspacing="0">
+                <tr><th {cell}>Hour</th>{head}</tr>
+                {rows}
+                <tr><td {cell}><b>Total</b></td>{total_row}</tr>
+            </table>
+            <p><b>Error bursts</b> (≥ {BURST_MIN} errors, ≤ {BURST_GAP}s apart)</p>
+            <ul>{burst_items}</ul>
+        """)
 
-        self.log_display.verticalScrollBar().setValue(0)
-        self.update_slider_range()
\ No newline at end of file
+    def closeEvent(self, event):
+        self._close_found()
+        self.day_stats.shutdown()
+        self.day_search.shutdown()
+        super().closeEvent(event)
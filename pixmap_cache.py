@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - pixmap_cache.py decoded, scaled little pictures kept close at hand
+-The last of the icon drawers kept every small picture already cut to size, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/pixmap_cache.py
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap
+
+
+class PixmapCache:
+    """App-wide LRU of decoded and scaled pixmaps 🌱
+
+    Keyed by (resolved path, mtime, target size), so replacing an image on disk
+    is picked up automatically, and the full-resolution decode happens once per
+    size rather than once per dialog open or list row. GUI thread only.
+    """
+    MAX_ENTRIES = 64
+    _entries = OrderedDict()
+
+    @classmethod
+    def get(cls, path, width, height, mode=Qt.KeepAspectRatio) -> QPixmap | None:
+        """path scaled to fit width×height, or None when it is missing or won't decode."""
+        if not path:
+            return None
+        resolved = Path(path).resolve()
+        try:
+            mtime = os.stat(resolved).st_mtime_ns
+        except OSError:
+            return None
+        key = (str(resolved), mtime, width, height, mode)
+        pix = cls._entries.get(key)
+        if pix is not None:
+            cls._entries.move_to_end(key)
+            return pix
+
+        pix = QPixmap(str(resolved))
+        if pix.isNull():
+            return None
+        pix = pix.scaled(width, height, mode, Qt.SmoothTransformation)
+        cls._entries[key] = pix
+        if len(cls._entries) > cls.MAX_ENTRIES:
+            cls._entries.popitem(last=False)
+        return pix
+
+    @classmethod
+    def clear(cls):
+        cls._entries.clear()
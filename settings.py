@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - settings.py the app's remembered preferences
+-The last of the settings kept everything in mind and only wrote it down once the fuss had settled, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/settings.py
+import os
+import json
+import time
+import atexit
+import threading
+
+from utils.helpers import Helpers
+
+SETTINGS_FILE = "settings.json"
+UNREADABLE_SUFFIX = ".unreadable"   # a settings file we couldn't parse is kept here, never overwritten
+# Earlier builds kept preferences in Qt's native store; imported once when settings.json doesn't exist yet
+LEGACY_ORG = LEGACY_APP = "Cushions"
+LEGACY_KEYS = {"api_key": "trello_api_key", "token": "trello_token",
+               "trello/api_key": "trello_api_key", "trello/token": "trello_token"}
+WRITE_DELAY = 0.4       # seconds of quiet before a burst of set() calls hits disk
+STAT_INTERVAL = 0.5     # how often reads may check the file for outside edits
+
+
+def _log():
+    from utils.logging import AppLogger  # late: the logger may read settings while it starts up
+    return AppLogger.get()
+
+
+class Settings:
+    """settings.json held in memory, written back once per burst of changes 🌱
+
+    Reads come from the in-memory dict; the file is re-read only when its mtime
+    or size moves (checked at most every STAT_INTERVAL). Writes mark keys dirty and
+    arm one debounced flush, which writes a temp file and renames it into place.
+    Anything still pending is flushed at exit. Safe to call from worker threads.
+
+    A settings file that exists but won't parse is never built over: reads fall
+    back to defaults, and the first flush moves it aside to settings.json.unreadable
+    before writing. With no settings file at all, values from the old QSettings
+    store are imported once.
+    """
+    _lock = threading.RLock()
+    _data = None
+    _stamp = None            # (mtime_ns, size) of the file as we last read or wrote it
+    _checked_at = 0.0
+    _dirty = {}              # key -> value set since the last flush
+    _timer = None
+    _unreadable = None       # stamp of a file that exists but couldn't be parsed
+    _imported = False
+
+    # ── reading ───────────────────────────────────────────────────
+
+    @staticmethod
+    def path() -> str:
+        return str(Helpers.get_project_root() / SETTINGS_FILE)
+
+    @classmethod
+    def _current(cls) -> dict:
+        now = time.monotonic()
+        if cls._data is not None and now - cls._checked_at < STAT_INTERVAL:
+            return cls._data
+        cls._checked_at = now
+        try:
+            st = os.stat(cls.path())
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if cls._data is None or stamp != cls._stamp:
+            cls._reload(stamp)
+        if cls._data is None:
+            return dict(cls._dirty)  # unreadable file: defaults plus what was set this session
+        return cls._data
+
+    @classmethod
+    def _reload(cls, stamp):
+        data = {}
+        if stamp is not None:
+            try:
+                with open(cls.path(), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("not a JSON object")
+            except (OSError, ValueError) as e:
+                if cls._data is not None:
+                    return  # mid-write by someone else — keep what we had, look again later
+                if stamp != cls._unreadable:
+                    _log().error(f"Could not read {cls.path()} ({e}); using defaults and leaving it untouched")
+                cls._unreadable = stamp
+                return
+        elif not cls._imported:
+            cls._import_legacy()
+        cls._unreadable = None
+        data.update(cls._dirty)  # our unsaved changes win over the file
+        cls._data, cls._stamp = data, stamp
+
+    @classmethod
+    def _import_legacy(cls):
+        """One-time copy of the old QSettings preferences into the pending changes."""
+        cls._imported = True
+        try:
+            from PySide6.QtCore import QSettings
+            store = QSettings(LEGACY_ORG, LEGACY_APP)
+            legacy = {LEGACY_KEYS.get(key, key): store.value(key) for key in store.allKeys()}
+            # Only values settings.json can hold (QByteArray geometry blobs and the like stay behind)
+            legacy = {k: v for k, v in legacy.items() if isinstance(v, (str, int, float, bool, list, dict, type(None)))}
+        except Exception as e:
+            _log().warning(f"Could not import previous settings: {e}")
+            return
+        if not legacy:
+            return
+        for key, value in legacy.items():
+            cls._dirty.setdefault(key, value)
+        _log().info(f"Imported {len(legacy)} setting(s) from the previous store 🌱")
+        cls._schedule_flush()
+
+    @classmethod
+    def get(cls, key: str, default=None):
+        with cls._lock:
+            return cls._current().get(key, default)
+
+    @classmethod
+    def get_directory(cls, key: str) -> str | None:
+        """A remembered folder, but only while it still exists."""
+        path = cls.get(key)
+        return path if path and os.path.isdir(path) else None
+
+    @classmethod
+    def get_trello_creds(cls) -> tuple[str, str]:
+        with cls._lock:
+            data = cls._current()
+            return data.get("trello_api_key") or "", data.get("trello_token") or ""
+
+    # ── writing ───────────────────────────────────────────────────
+
+    @classmethod
+    def set(cls, key: str, value) -> None:
+        with cls._lock:
+            data = cls._current()
+            if key in data and data[key] == value and key not in cls._dirty:
+                return
+            data[key] = value
+            cls._dirty[key] = value
+            cls._schedule_flush()
+
+    @classmethod
+    def set_directory(cls, key: str, path: str) -> None:
+        cls.set(key, path)
+
+    @classmethod
+    def set_trello_creds(cls, api_key: str, token: str) -> None:
+        with cls._lock:
+            cls.set("trello_api_key", api_key)
+            cls.set("trello_token", token)
+
+    @classmethod
+    def _schedule_flush(cls):
+        if cls._timer is not None:
+            cls._timer.cancel()
+        cls._timer = threading.Timer(WRITE_DELAY, cls.flush)
+        cls._timer.daemon = True
+        cls._timer.start()
+
+    @classmethod
+    def flush(cls) -> None:
+        """Write pending changes now (one temp-file + rename)."""
+        with cls._lock:
+            if cls._timer is not None:
+                cls._timer.cancel()
+                cls._timer = None
+            if not cls._dirty:
+                return
+            cls._checked_at = 0.0
+            data = cls._current()  # fold in any outside edit before overwriting
+            path = cls.path()
+            tmp = path + ".tmp"
+            if cls._data is None:
+                # The file on disk won't parse: keep it for the user instead of writing over it
+                try:
+                    os.replace(path, path + UNREADABLE_SUFFIX)
+                except OSError:
+                    cls._schedule_flush()
+                    return
+                _log().error(f"Moved unreadable {path} to {path + UNREADABLE_SUFFIX}; starting a fresh one")
+                cls._unreadable = None
+            try:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp, path)
+                st = os.stat(path)
+            except OSError:
+                cls._schedule_flush()  # disk hiccup — keep the changes and try again shortly
+                return
+            cls._dirty = {}
+            cls._data = data
+            cls._stamp = (st.st_mtime_ns, st.st_size)
+            cls._checked_at = time.monotonic()
+
+
+atexit.register(Settings.flush)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+-Cushions - theme.py one stylesheet for the whole cozy home
+-The last of the themes was read once at the door and remembered by every room after, For Enjoying
+-Built using a single shared braincell by Yours Truly and various Intelligences
+"""
+
+# utils/theme.py
+from PySide6.QtWidgets import QApplication
+
+COZY_QSS = """
+/* ── Drop area ─────────────────────────────────────────────── */
+QFrame#CozyDropArea {
+    background-color: #3a3a3a;
+    border: 2px dashed #6b5a47;
+    border-radius: 12px;
+    color: #8a7a67;
+    font-size: 16px;
+}
+QFrame#CozyDropArea:hover {
+    border: 2px solid #8a7a67;
+    background-color: #444;
+}
+QFrame#CozyDropArea[dragHover="true"] {
+    background-color: #444;
+    border: 2px solid #8a7a67;
+    color: #fff;
+}
+QLabel#CozyDropLabel {
+    color: #8a7a67;
+    border: none;
+    background: transparent;
+}
+
+/* ── Settings ──────────────────────────────────────────────── */
+QDialog#SettingsDialog,
+QDialog#SettingsDialog QWidget {
+    background-color: #1e1e1e;
+    color: #e0e0e0;
+}
+QDialog#SettingsDialog QPushButton {
+    background-color: #3a3a3a;
+    border: 1px solid #6b5a47;
+    border-radius: 6px;
+    color: #e0f0e0;
+    padding: 6px 12px;
+    font-size: 13px;
+}
+QDialog#SettingsDialog QPushButton:hover { background-color: #444444; }
+QDialog#SettingsDialog QPushButton:disabled { background-color: #2a2a2a; color: #666666; }
+QDialog#SettingsDialog QPushButton[quiet="true"] {
+    background-color: #2a2a2a;
+    border: 1px solid #4a3a2f;
+    color: #a08a7a;
+    padding: 4px 8px;
+}
+QDialog#SettingsDialog QPushButton[quiet="true"]:hover { background-color: #333333; color: #e0e0e0; }
+QDialog#SettingsDialog QLabel[role="status"] { color: #8a7a67; font-size: 13px; }
+QDialog#SettingsDialog QLabel[role="status"][status="ok"] { color: #a0d0a0; }
+QDialog#SettingsDialog QLabel[role="status"][status="error"] { color: #e08080; }
+QDialog#SettingsDialog QFrame[role="separator"] { background-color: #333333; max-height: 1px; }
+
+/* ── Feature list ──────────────────────────────────────────── */
+QDialog#FeatureListDialog,
+QDialog#FeatureListDialog QWidget {
+    background-color: #1e1e1e;
+    color: #e0e0e0;
+}
+QLabel#FeatureTitle { font-size: 18px; font-weight: bold; color: #8a7a67; }
+QListView#FeatureList { border: none; font-size: 13px; }
+QListView#FeatureList::item { padding: 2px 0px; }
+"""
+
+
+class Theme:
+    """The one app-wide stylesheet — parsed once, then widgets only flip names and properties 🌱"""
+
+    _installed = False
+
+    @classmethod
+    def install(cls, app: QApplication | None = None) -> None:
+        """Attach the cozy sheet to the application; safe to call from every dialog."""
+        if cls._installed:
+            return
+        app = app or QApplication.instance()
+        if app is None:
+            return
+        app.setStyleSheet(app.styleSheet() + COZY_QSS)
+        cls._installed = True
+
+    @staticmethod
+    def set_state(widget, name: str, value) -> None:
+        """Flip a dynamic property and re-polish just this widget (no stylesheet re-parse)."""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
@@ -7,6 +7,7 @@
 """
 # (First stitched together with Grok, in the cozy era.)
 
+import logging
 import requests
 from typing import Optional, Tuple
 from pathlib import Path
@@ -14,6 +15,7 @@ from pathlib import Path
 from PySide6.QtCore import QThread
 
 from utils.logging import AppLogger
+from utils.log_pipeline import StructuredLog, phase_timer, UPLOAD_STARTED, UPLOAD_FINISHED
 from utils.settings import Settings
 
 from cozy.worker import UploadWorker
@@ -22,6 +24,8 @@ from cozy.worker import UploadWorker
 class TrelloAPI:
     """Beautiful TrelloAPI class — clean, reusable, and full of cozy warmth 🌱"""
 
+    VERIFY_TIMEOUT = (3.05, 5)   # (connect, read) seconds — an offline machine gives up quickly
+
     def __init__(self, api_key: str, token: str):
         """🌱 Validates credentials on creation — both presence and real API test"""
         if not api_key or not token:
@@ -30,6 +34,8 @@ class TrelloAPI:
         self.api_key = api_key
         self.token = token
         self.logger = AppLogger.get()
+        # Card-level lines carry phase/card_id/latency; route them through the JSON writer
+        StructuredLog.install(self.logger, self.logger.get_today_log_path)
 
         # Real credentials test — gentle but thorough
         if not self.verify_credentials():
@@ -48,13 +54,22 @@ class TrelloAPI:
 
     def verify_credentials(self) -> bool:
         """Check if the provided API key and token are valid with Trello."""
+        return self.check_credentials(self.api_key, self.token) is True
+
+    @classmethod
+    def check_credentials(cls, api_key: str, token: str) -> Optional[bool]:
+        """True/False when Trello gave a definite answer, None when it couldn't be asked."""
         url = "https://api.trello.com/1/members/me"
-        params = {'key': self.api_key, 'token': self.token}
+        params = {'key': api_key, 'token': token}
         try:
-            response = requests.get(url, params=params, timeout=5)
-            return response.status_code == 200
+            response = requests.get(url, params=params, timeout=cls.VERIFY_TIMEOUT)
         except requests.RequestException:
-            return False
+            return None
+        if response.status_code == 200:
+            return True
+        if response.status_code == 429 or response.status_code >= 500:
+            return None  # rate limited or Trello having a moment — says nothing about the keys
+        return False
 
     def get_board_by_name(self, board_name: str) -> Optional[Tuple[str, str]]:
         """🌱 Gentle lookup: returns (id, shortUrl) of first board with exact matching name, or None"""
@@ -184,7 +199,9 @@ class TrelloAPI:
 
     def upload_paragraphs_to_list(self, list_id: str, paragraphs: list[str], progress_callback=None, status_callback=None) -> int:
         """High-level cozy method that handles the entire paragraph → card loop with smart deduplication 🌱"""
-        existing_names = self.get_card_names_in_list(list_id)
+        with phase_timer(self.logger, "fetch_existing") as outcome:
+            existing_names = self.get_card_names_in_list(list_id)
+            outcome["msg"] = f"{len(existing_names)} cards already in list"
         created = 0
 
         for i, para in enumerate(paragraphs, 1):
@@ -208,6 +225,8 @@ class TrelloAPI:
             desc = (para[:4000] + "…") if len(para) > 4000 else para
 
             if card_name in existing_names:
+                self.logger.info(f"Skipped (already exists): {card_name[:60]}",
+                                 extra={"phase": "skip_card", "card_id": i})
                 if status_callback:
                     status_callback(f"Skipped (already exists): {card_name[:30]}...")
                 if progress_callback:
@@ -215,7 +234,9 @@ class TrelloAPI:
                 QThread.msleep(180)   # gentle for skips
                 continue
 
-            self.create_card(list_id, card_name, desc)
+            with phase_timer(self.logger, "create_card", card_id=i, msg=f"Created: {card_name[:60]}") as outcome:
+                if not self.create_card(list_id, card_name, desc):
+                    outcome.update(level=logging.WARNING, msg=f"Create failed: {card_name[:60]}")
             existing_names.add(card_name)
             created += 1
 
@@ -245,12 +266,15 @@ class TrelloAPI:
         board_id, board_url = self.create_board()
         todo_id = self.create_list(board_id, "To Review 🌅")
 
-        created = self.upload_paragraphs_to_list(
-            todo_id,
-            paragraphs,
-            progress_callback=progress_callback,
-            status_callback=status_callback
-        )
+        self.logger.info(f"{UPLOAD_STARTED}: {file_path.name} ({len(paragraphs)} paragraphs)")
+        with phase_timer(self.logger, "upload") as outcome:
+            created = self.upload_paragraphs_to_list(
+                todo_id,
+                paragraphs,
+                progress_callback=progress_callback,
+                status_callback=status_callback
+            )
+            outcome["msg"] = f"{UPLOAD_FINISHED}: {file_path.name}: {created} of {len(paragraphs)} cards created"
 
         return created, board_url
 